@@ -17,9 +17,13 @@
 
 
 import pandas as pd
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 import numpy as np
-dete_survey = pd.read_csv('dete_survey.csv')
-tafe_survey = pd.read_csv('tafe_survey.csv')
+dete_survey = csv_cache.read_csv('dete_survey.csv')
+tafe_survey = csv_cache.read_csv('tafe_survey.csv')
 
 pd.options.display.max_columns = 150
 dete_survey.head()
@@ -57,7 +61,7 @@ tafe_survey.info()
 # In[5]:
 
 
-dete_survey = pd.read_csv('dete_survey.csv', na_values='Not Stated')
+dete_survey = csv_cache.read_csv('dete_survey.csv', na_values='Not Stated')
 dete_survey.head()
 
 
@@ -7,9 +7,13 @@
 
 
 import pandas as pd
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 
-train = pd.read_csv("train.csv")
-holdout = pd.read_csv("test.csv")
+train = csv_cache.read_csv("train.csv")
+holdout = csv_cache.read_csv("test.csv")
 
 
 # In[2]:
@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+
 def process_missing(df):
     """Handle various missing values from the data set
 
@@ -92,4 +95,116 @@ def create_dummies(df,column_name):
     """
     dummies = pd.get_dummies(df[column_name],prefix=column_name)
     df = pd.concat([df,dummies],axis=1)
-    return df
\ No newline at end of file
+    return df
+
+class TitanicPipeline:
+    """Fit/transform version of the preprocessing functions above
+
+    fit() learns the Fare fill value, the bin edges and the dummy
+    vocabularies from the training frame once. transform() then turns any
+    batch into the same fixed column layout in a single pass, without
+    copying the input or reading a global train frame, so holdout and live
+    rows can't drift in columns.
+
+    Usage
+    ------
+
+    pipeline = TitanicPipeline().fit(train)
+    train_X = pipeline.transform(train)
+    holdout_X = pipeline.transform(holdout)
+    """
+    age_cut_points = [-1,0,5,12,18,35,60,100]
+    age_label_names = ["Missing","Infant","Child","Teenager","Young Adult","Adult","Senior"]
+    fare_cut_points = [-1,12,50,100,1000]
+    fare_label_names = ["0-12","12-50","50-100","100+"]
+    titles = {
+        "Mr" :         "Mr",
+        "Mme":         "Mrs",
+        "Ms":          "Mrs",
+        "Mrs" :        "Mrs",
+        "Master" :     "Master",
+        "Mlle":        "Miss",
+        "Miss" :       "Miss",
+        "Capt":        "Officer",
+        "Col":         "Officer",
+        "Major":       "Officer",
+        "Dr":          "Officer",
+        "Rev":         "Officer",
+        "Jonkheer":    "Royalty",
+        "Don":         "Royalty",
+        "Sir" :        "Royalty",
+        "Countess":    "Royalty",
+        "Dona":        "Royalty",
+        "Lady" :       "Royalty"
+    }
+    numeric_columns = ["PassengerId","Pclass","Age","SibSp","Parch","Fare"]
+
+    def fit(self, df):
+        self.fare_fill = df["Fare"].mean()
+        categories = self.categorical(df)
+        self.vocabularies = {
+            "Age_categories": self.age_label_names,
+            "Fare_categories": self.fare_label_names,
+            "Title": sorted(categories["Title"].dropna().unique()),
+            "Cabin_type": sorted(categories["Cabin_type"].unique()),
+            "Sex": sorted(df["Sex"].dropna().unique()),
+        }
+        self.columns = list(self.numeric_columns) + ["isalone"]
+        for column, vocabulary in self.vocabularies.items():
+            self.columns += ["{}_{}".format(column, value) for value in vocabulary]
+        return self
+
+    def bins(self, values, cut_points):
+        # Same intervals as pd.cut: (a, b], -1 when outside every bin
+        codes = np.searchsorted(cut_points, values, side="left") - 1
+        outside = (codes < 0) | (codes >= len(cut_points) - 1) | np.isnan(values)
+        codes[outside] = -1
+        return codes
+
+    def categorical(self, df):
+        extracted_titles = df["Name"].str.extract(r' ([A-Za-z]+)\.',expand=False)
+        return {
+            "Title": extracted_titles.map(self.titles),
+            "Cabin_type": df["Cabin"].str[0].fillna("Unknown"),
+        }
+
+    def transform(self, df):
+        n = len(df)
+        age = df["Age"].fillna(-0.5).to_numpy(dtype=np.float64)
+        fare = df["Fare"].fillna(self.fare_fill).to_numpy(dtype=np.float64)
+        family = (df["SibSp"] + df["Parch"]).to_numpy()
+        numeric = {
+            "PassengerId": df["PassengerId"].to_numpy(),
+            "Pclass": df["Pclass"].to_numpy(),
+            "Age": age,
+            "SibSp": df["SibSp"].to_numpy(),
+            "Parch": df["Parch"].to_numpy(),
+            "Fare": fare,
+            "isalone": (family == 0).astype(np.int64),
+        }
+
+        categories = self.categorical(df)
+        codes = {
+            "Age_categories": self.bins(age, self.age_cut_points),
+            "Fare_categories": self.bins(fare, self.fare_cut_points),
+        }
+        for column, values in [("Title", categories["Title"]),
+                               ("Cabin_type", categories["Cabin_type"]),
+                               ("Sex", df["Sex"])]:
+            codes[column] = pd.Categorical(values, categories=self.vocabularies[column]).codes
+
+        width = sum(len(vocabulary) for vocabulary in self.vocabularies.values())
+        dummies = np.zeros((n, width), dtype=np.uint8)
+        rows = np.arange(n)
+        offset = 0
+        for column, vocabulary in self.vocabularies.items():
+            known = codes[column] >= 0
+            dummies[rows[known], offset + codes[column][known]] = 1
+            offset += len(vocabulary)
+
+        out = pd.DataFrame(numeric, index=df.index)
+        dummy_frame = pd.DataFrame(dummies, index=df.index, columns=self.columns[len(numeric):])
+        return pd.concat([out, dummy_frame], axis=1)
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
@@ -0,0 +1,58 @@
+import sys
+import time
+import joblib
+import pandas as pd
+
+def save_artifact(model, pipeline, cols, filename="model.joblib"):
+    """Save the chosen model, its fitted TitanicPipeline and feature columns together
+
+    Usage
+    ------
+
+    pipeline = TitanicPipeline().fit(train)
+    save_artifact(best_rf_model, pipeline, cols)
+    """
+    joblib.dump({"model": model, "pipeline": pipeline, "cols": list(cols)}, filename)
+
+def load_artifact(filename="model.joblib"):
+    return joblib.load(filename)
+
+def score_file(input_file, output_file="submission.csv", artifact="model.joblib", chunksize=100000):
+    """Stream input_file through the saved pipeline and model in chunks
+
+    Each chunk is transformed, predicted and appended to output_file as
+    PassengerId,Survived before the next is read, so memory is bounded by
+    chunksize. Prints rows, latency and throughput per batch and returns the
+    per-batch stats as a DataFrame.
+
+    Usage
+    ------
+
+    score_file("test.csv")
+    """
+    saved = load_artifact(artifact) if isinstance(artifact, str) else artifact
+    model, pipeline, cols = saved["model"], saved["pipeline"], saved["cols"]
+    stats = []
+    total_start = time.perf_counter()
+    header = True
+    for batch, chunk in enumerate(pd.read_csv(input_file, chunksize=chunksize)):
+        start = time.perf_counter()
+        features = pipeline.transform(chunk)
+        predictions = model.predict(features[cols])
+        submission = pd.DataFrame({"PassengerId": chunk["PassengerId"],
+                                   "Survived": predictions})
+        submission.to_csv(output_file, index=False, header=header, mode="w" if header else "a")
+        header = False
+        seconds = time.perf_counter() - start
+        stats.append({"batch": batch, "rows": len(chunk), "seconds": seconds,
+                      "rows_per_second": len(chunk) / seconds if seconds else float("inf")})
+        print("batch {}: {} rows in {:.3f}s ({:.0f} rows/s)".format(
+            batch, len(chunk), seconds, stats[-1]["rows_per_second"]))
+    total = time.perf_counter() - total_start
+    rows = sum(entry["rows"] for entry in stats)
+    print("total: {} rows in {:.3f}s ({:.0f} rows/s)".format(rows, total, rows / total))
+    return pd.DataFrame(stats)
+
+if __name__ == "__main__":
+    #Usage: python scoring.py input.csv [output.csv] [artifact]
+    score_file(*sys.argv[1:4])
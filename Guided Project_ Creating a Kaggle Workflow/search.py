@@ -0,0 +1,153 @@
+import os
+import json
+import hashlib
+import numpy as np
+from joblib import Parallel, delayed, hash as joblib_hash
+from sklearn.base import clone, is_classifier
+from sklearn.model_selection import ParameterGrid, check_cv
+
+CACHE_DIR = ".search_cache"
+
+def cell_key(estimator, params, fold, n_splits, data_hash):
+    """Key one (estimator, params, fold) cell on everything its score depends on"""
+    configured = clone(estimator).set_params(**params)
+    settings = {name: repr(value) for name, value in configured.get_params(deep=False).items()}
+    key = json.dumps([type(estimator).__name__, settings, fold, n_splits, data_hash], sort_keys=True)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+def read_score(cache_dir, key):
+    path = os.path.join(cache_dir, key[:2], key + ".json")
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)["score"]
+    return None
+
+def write_score(cache_dir, key, score):
+    directory = os.path.join(cache_dir, key[:2])
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, key + ".json")
+    with open(path + ".tmp", "w") as f:
+        json.dump({"score": score}, f)
+    os.replace(path + ".tmp", path)
+
+def fit_and_score(estimator, params, X, y, train_index, test_index, cache_dir, key):
+    # Each cell saves its own score, so an interrupted search keeps every finished fit
+    model = clone(estimator).set_params(**params)
+    model.fit(X[train_index], y[train_index])
+    score = float(model.score(X[test_index], y[test_index]))
+    write_score(cache_dir, key, score)
+    return score
+
+class CachedGridSearch:
+    """GridSearchCV replacement that runs fits on every core and remembers scores
+
+    Every (estimator, params, fold) score is written to cache_dir, keyed on
+    the estimator settings, fold and a hash of the data, so a rerun only fits
+    the cells it has not seen. With halving=True candidates are scored on
+    min_folds folds first and only the best 1/factor go on to more folds,
+    until the survivors have been scored on all of them. Scores are the mean
+    over all folds, like GridSearchCV.best_score_.
+
+    Usage
+    ------
+
+    grid = CachedGridSearch(KNeighborsClassifier(), param_grid, cv=10)
+    grid.fit(all_X, all_y)
+    grid.best_params_, grid.best_score_, grid.best_estimator_
+    """
+    def __init__(self, estimator, param_grid, cv=10, n_jobs=-1, cache_dir=CACHE_DIR,
+                 halving=False, factor=3, min_folds=2, verbose=0):
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.cache_dir = cache_dir
+        self.halving = halving
+        self.factor = factor
+        self.min_folds = min_folds
+        self.verbose = verbose
+
+    def score_cells(self, cells, X, y, splits, data_hash):
+        """Return {(candidate, fold): score}, fitting only the uncached cells"""
+        scores = {}
+        pending = []
+        for candidate, fold in cells:
+            key = cell_key(self.estimator, self.candidates_[candidate], fold, len(splits), data_hash)
+            score = read_score(self.cache_dir, key)
+            if score is None:
+                pending.append((candidate, fold, key))
+            else:
+                scores[(candidate, fold)] = score
+        results = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
+            delayed(fit_and_score)(self.estimator, self.candidates_[candidate], X, y, *splits[fold],
+                                   self.cache_dir, key)
+            for candidate, fold, key in pending)
+        for (candidate, fold, key), score in zip(pending, results):
+            scores[(candidate, fold)] = score
+        self.n_fits_ += len(pending)
+        self.n_cached_ += len(cells) - len(pending)
+        return scores
+
+    def fit(self, X, y):
+        if self.halving and (self.factor <= 1 or self.min_folds < 1):
+            raise ValueError("halving needs factor > 1 and min_folds >= 1, got factor={0!r}, min_folds={1!r}"
+                             .format(self.factor, self.min_folds))
+        original_X, original_y = X, y
+        X = np.asarray(X)
+        y = np.asarray(y)
+        cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+        splits = list(cv.split(X, y))
+        data_hash = joblib_hash((X, y, [test.tolist() for train, test in splits]))
+        self.candidates_ = list(ParameterGrid(self.param_grid))
+        self.n_fits_ = 0
+        self.n_cached_ = 0
+
+        alive = list(range(len(self.candidates_)))
+        folds = len(splits)
+        if self.halving:
+            folds = min(self.min_folds, len(splits))
+        scores = {}
+        while True:
+            cells = [(candidate, fold) for candidate in alive for fold in range(folds)
+                     if (candidate, fold) not in scores]
+            scores.update(self.score_cells(cells, X, y, splits, data_hash))
+            if folds == len(splits):
+                break
+            means = [np.mean([scores[(candidate, fold)] for fold in range(folds)]) for candidate in alive]
+            keep = max(1, int(np.ceil(len(alive) / self.factor)))
+            order = np.argsort(-np.array(means), kind="stable")[:keep]
+            alive = sorted(alive[i] for i in order)
+            folds = min(folds * self.factor, len(splits))
+
+        self.mean_scores_ = {candidate: float(np.mean([scores[(candidate, fold)] for fold in range(folds)]))
+                             for candidate in alive}
+        best = max(alive, key=lambda candidate: (self.mean_scores_[candidate], -candidate))
+        self.best_params_ = self.candidates_[best]
+        self.best_score_ = self.mean_scores_[best]
+        # Refit on the caller's X so a DataFrame's feature names are kept for predict
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(original_X, original_y)
+        return self
+
+def select_model_cached(all_X, all_y, models, cv=10, halving=False, cache_dir=CACHE_DIR):
+    """Run CachedGridSearch over the model dicts used by select_model
+
+    Fills in best_params, best_score and best_model on each dict, the same
+    way select_model does, and prints the same summary.
+    """
+    for model in models:
+        print(model['name'])
+        print('-'*len(model['name']))
+
+        grid = CachedGridSearch(model["estimator"],
+                                param_grid=model["hyperparameters"],
+                                cv=cv, halving=halving, cache_dir=cache_dir)
+        grid.fit(all_X,all_y)
+        model["best_params"] = grid.best_params_
+        model["best_score"] = grid.best_score_
+        model["best_model"] = grid.best_estimator_
+
+        print("Best Score: {}".format(model["best_score"]))
+        print("Best Parameters: {}".format(model["best_params"]))
+        print("Fits: {} run, {} from cache\n".format(grid.n_fits_, grid.n_cached_))
+
+    return models
@@ -0,0 +1,106 @@
+import time
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_selection import RFE
+from sklearn.model_selection import check_cv
+
+def make_splits(X, y, estimator, cv=10):
+    """Precompute the CV folds once so repeated selections reuse them"""
+    cv = check_cv(cv, y, classifier=is_classifier(estimator))
+    return list(cv.split(X, y))
+
+def fold_step(estimator, X, y, train_index, test_index, features):
+    # Fit on the surviving features, score, and name the weakest one
+    model = clone(estimator)
+    model.fit(X[np.ix_(train_index, features)], y[train_index])
+    score = model.score(X[np.ix_(test_index, features)], y[test_index])
+    importances = getattr(model, "feature_importances_", None)
+    if importances is None:
+        importances = np.abs(model.coef_).sum(axis=0) if model.coef_.ndim > 1 else np.abs(model.coef_)
+    return score, features[np.argsort(importances)[0]]
+
+class FastRFECV:
+    """RFECV that steps all folds together so it can stop on a plateau
+
+    Every fold starts from all features. Each step refits the estimator on
+    every fold in parallel, records the mean test score for the current
+    feature count and drops each fold's least important feature, as RFECV
+    does with step=1. Once the mean score has not beaten the best by more
+    than tol for patience steps the search stops. The chosen count is then
+    selected with RFE on all rows. Per-step wall time goes in step_log_.
+
+    Usage
+    ------
+
+    splits = make_splits(all_X, all_y, clf)
+    selector = FastRFECV(clf, splits, patience=5).fit(all_X, all_y)
+    all_X.columns[selector.support_]
+    """
+    def __init__(self, estimator, splits, patience=None, tol=0.0, n_jobs=-1, verbose=True):
+        self.estimator = estimator
+        self.splits = splits
+        self.patience = patience
+        self.tol = tol
+        self.n_jobs = n_jobs
+        self.verbose = verbose
+
+    def fit(self, X, y):
+        X = np.asarray(X)
+        y = np.asarray(y)
+        n_features = X.shape[1]
+        remaining = [np.arange(n_features) for _ in self.splits]
+        self.scores_ = {}
+        self.step_log_ = []
+        best_score = -np.inf
+        since_best = 0
+
+        with Parallel(n_jobs=self.n_jobs) as parallel:
+            for count in range(n_features, 0, -1):
+                start = time.perf_counter()
+                results = parallel(delayed(fold_step)(self.estimator, X, y, train_index, test_index, features)
+                                   for (train_index, test_index), features in zip(self.splits, remaining))
+                score = float(np.mean([fold_score for fold_score, weakest in results]))
+                seconds = time.perf_counter() - start
+                self.scores_[count] = score
+                self.step_log_.append({"n_features": count, "score": score, "seconds": seconds})
+                if self.verbose:
+                    print("{} features: score {:.4f} in {:.2f}s".format(count, score, seconds))
+
+                remaining = [features[features != weakest]
+                             for features, (fold_score, weakest) in zip(remaining, results)]
+                if score > best_score + self.tol:
+                    best_score = score
+                    since_best = 0
+                else:
+                    since_best += 1
+                    if self.patience is not None and since_best >= self.patience:
+                        if self.verbose:
+                            print("stopping: no improvement in {} steps".format(since_best))
+                        break
+
+        # Like RFECV, ties go to the smallest feature count
+        self.n_features_ = max(self.scores_, key=lambda count: (self.scores_[count], -count))
+        rfe = RFE(clone(self.estimator), n_features_to_select=self.n_features_, step=1).fit(X, y)
+        self.support_ = rfe.support_
+        self.ranking_ = rfe.ranking_
+        self.estimator_ = rfe.estimator_
+        return self
+
+def select_features_fast(df, splits=None, patience=None):
+    """select_features with FastRFECV in place of RFECV(cv=10)"""
+    df = df.select_dtypes([np.number]).dropna(axis=1)
+    all_X = df.drop(["Survived","PassengerId"],axis=1)
+    all_y = df["Survived"]
+
+    clf = RandomForestClassifier(random_state=1)
+    if splits is None:
+        splits = make_splits(all_X, all_y, clf)
+    selector = FastRFECV(clf, splits, patience=patience)
+    selector.fit(all_X,all_y)
+
+    best_columns = list(all_X.columns[selector.support_])
+    print("Best Columns \n"+"-"*12+"\n{}\n".format(best_columns))
+
+    return best_columns
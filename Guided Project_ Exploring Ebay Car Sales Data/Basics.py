@@ -36,13 +36,17 @@
 
 
 import pandas as pd
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 import numpy as np
 
 
 # In[2]:
 
 
-autos = pd.read_csv('autos.csv', encoding = 'Latin-1')
+autos = csv_cache.read_csv('autos.csv', encoding = 'Latin-1')
 autos.info()
 autos.head()
 
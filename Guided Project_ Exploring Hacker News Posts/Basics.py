@@ -23,10 +23,13 @@
 # In[1]:
 
 
-from csv import reader
-opened_file = open('hacker_news.csv')
-read_file = reader(opened_file)
-hn = list(read_file)
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
+#Every field as text, like csv.reader, with the header as the first row
+hn_df = csv_cache.read_csv('hacker_news.csv', dtype=str, keep_default_na=False)
+hn = [list(hn_df.columns)] + hn_df.values.tolist()
 hn[:5]
 
 
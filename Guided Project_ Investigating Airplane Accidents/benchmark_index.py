@@ -0,0 +1,60 @@
+import sys
+import time
+import random
+from index import AccidentIndex, load_records, date_key
+
+#Time the three read.py searches against the index for the same queries
+#Usage: python benchmark_index.py [queries]
+queries = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+f = open("AviationData.txt", "r")
+aviation_data = f.read().split("\n")
+f.close()
+aviation_list = [row.split(" | ") for row in aviation_data]
+aviation_dict_list = load_records()
+random.seed(1)
+targets = [record['Accident Number'] for record in random.sample(aviation_dict_list, queries)]
+
+def nested_scan(code):
+    lax_code = []
+    for i in range(len(aviation_list)):
+        for j in range(len(aviation_list[i])):
+            if aviation_list[i][j] == code:
+                lax_code.append(aviation_list[i])
+    return lax_code
+
+def list_scan(code):
+    return [row for row in aviation_list if code in row]
+
+def dict_scan(code):
+    return [dictionary for dictionary in aviation_dict_list if code in dictionary.values()]
+
+def timed(search):
+    start = time.perf_counter()
+    for code in targets:
+        search(code)
+    return (time.perf_counter() - start) / len(targets)
+
+start = time.perf_counter()
+index = AccidentIndex(aviation_dict_list)
+build = time.perf_counter() - start
+
+print("{0} rows, {1} point lookups each".format(len(aviation_dict_list), queries))
+print("index build: {0:.3f}s".format(build))
+for name, search in [("nested list scan", nested_scan), ("list scan", list_scan),
+                     ("dict scan", dict_scan), ("index lookup", index.lookup)]:
+    print("{0}: {1:.6f}s per query".format(name, timed(search)))
+
+start_date, end_date = '01/01/1995', '12/31/2000'
+start = time.perf_counter()
+scanned = [record for record in aviation_dict_list
+           if date_key(record.get('Event Date', '')) is not None
+           and date_key(start_date) <= date_key(record['Event Date']) <= date_key(end_date)]
+scan_time = time.perf_counter() - start
+start = time.perf_counter()
+indexed = index.between(start_date, end_date)
+index_time = time.perf_counter() - start
+same = (sorted(record['Accident Number'] for record in scanned)
+        == sorted(record['Accident Number'] for record in indexed))
+print("date range scan: {0:.6f}s, index range: {1:.6f}s, same rows: {2}".format(
+    scan_time, index_time, same))
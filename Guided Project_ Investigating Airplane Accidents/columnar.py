@@ -0,0 +1,166 @@
+import sys
+from array import array
+from collections import Counter
+from records import read_rows, to_int
+
+class Row:
+    """Read-only dict-like view of one row of a ColumnStore"""
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, name):
+        value = self.store.value(name, self.row)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def get(self, name, default=None):
+        value = self.store.value(name, self.row)
+        return default if value is None else value
+
+    def __contains__(self, name):
+        return name in self.store.columns and self.store.value(name, self.row) is not None
+
+    def keys(self):
+        return [name for name in self.store.names if name in self]
+
+    def values(self):
+        return [self[name] for name in self.keys()]
+
+class ColumnStore:
+    """aviation_dict_list stored as one array per column
+
+    Columns with few distinct values (Country, Injury Severity, the injury
+    totals...) are dictionary encoded: an array of small int codes plus one
+    interned copy of each distinct string. The rest stay as lists of
+    strings. Values missing from ragged rows are None. Indexing gives a Row
+    view that reads like the dicts in read.py.
+
+    Usage
+    ------
+
+    store = ColumnStore.from_file("AviationData.txt")
+    store[0]['Country']
+    state_counts(store)
+    """
+    def __init__(self, names, columns, length):
+        self.names = names
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def from_rows(cls, names, rows, max_ratio=0.5):
+        raw = {name: [] for name in names}
+        length = 0
+        for split in rows:
+            for i, name in enumerate(names):
+                raw[name].append(split[i] if i < len(split) else None)
+            length += 1
+        columns = {name: cls.encode(values, max_ratio) for name, values in raw.items()}
+        return cls(names, columns, length)
+
+    @classmethod
+    def from_file(cls, filename="AviationData.txt"):
+        names, rows = read_rows(filename)
+        return cls.from_rows(names, rows)
+
+    @staticmethod
+    def encode(values, max_ratio):
+        distinct = {}
+        for value in values:
+            if value not in distinct:
+                distinct[value] = len(distinct)
+                if len(distinct) > max_ratio * len(values) or len(distinct) > 65535:
+                    return ('plain', values)
+        lookup = [sys.intern(value) if value is not None else None for value in distinct]
+        codes = array('H', [distinct[value] for value in values])
+        return ('coded', codes, lookup)
+
+    def value(self, name, row):
+        column = self.columns.get(name)
+        if column is None:
+            return None
+        if column[0] == 'coded':
+            return column[2][column[1][row]]
+        return column[1][row]
+
+    def column(self, name):
+        """All values of one column as a list"""
+        column = self.columns[name]
+        if column[0] == 'coded':
+            lookup = column[2]
+            return [lookup[code] for code in column[1]]
+        return list(column[1])
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self.length
+        if not 0 <= row < self.length:
+            raise IndexError(row)
+        return Row(self, row)
+
+    def __iter__(self):
+        for row in range(self.length):
+            yield Row(self, row)
+
+def state_counts(store):
+    """Counter of two-letter states for United States accidents, as in read.py"""
+    state_accidents_list = []
+    for country, location in zip(store.column('Country'), store.column('Location')):
+        if country == 'United States':
+            state_list = location.split(", ")
+            state = state_list[1] if len(state_list) > 1 else ""
+            if len(state) == 2:
+                state_accidents_list.append(state)
+    return Counter(state_accidents_list)
+
+def monthly_injuries(store):
+    """MM/YYYY -> serious and fatal injury totals, computed the same way as read.py
+
+    Like read.py, a month's first accident seeds the totals and is then
+    added once more.
+    """
+    monthly_injuries = {}
+    columns = zip(store.column('Event Date'), store.column('Total Serious Injuries'),
+                  store.column('Total Fatal Injuries'))
+    for event_date, serious, fatal in columns:
+        if event_date is None:
+            continue
+        split_date = event_date.split('/')
+        if len(split_date) < 3:
+            continue
+        month = split_date[0] + '/' + split_date[2]
+        if len(month) != 7:
+            continue
+        s_injury = to_int(serious)
+        f_injury = to_int(fatal)
+        if month not in monthly_injuries:
+            monthly_injuries[month] = {'Serious Injury': s_injury, 'Fatal Injury': f_injury}
+        monthly_injuries[month]['Serious Injury'] += s_injury
+        monthly_injuries[month]['Fatal Injury'] += f_injury
+    return monthly_injuries
+
+if __name__ == "__main__":
+    import tracemalloc
+    from index import load_records
+
+    tracemalloc.start()
+    aviation_dict_list = load_records()
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    del aviation_dict_list
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    store = ColumnStore.from_file()
+    store_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print("list of dicts: {0:.1f} MB".format(dict_bytes / 1e6))
+    print("column store: {0:.1f} MB".format(store_bytes / 1e6))
+    print(state_counts(store).most_common(10))
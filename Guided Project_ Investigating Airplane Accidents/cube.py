@@ -0,0 +1,143 @@
+import numpy as np
+from records import iter_records, to_int
+
+MEASURES = ['Serious Injury', 'Fatal Injury']
+
+def parse_month(event_date):
+    #MM/DD/YYYY -> (year, month) or None
+    split_date = event_date.split('/')
+    if len(split_date) != 3 or len(split_date[2]) != 4:
+        return None
+    try:
+        month = int(split_date[0])
+        year = int(split_date[2])
+    except ValueError:
+        return None
+    if not 1 <= month <= 12:
+        return None
+    return year, month
+
+def parse_state(record):
+    if record.get('Country') != 'United States':
+        return None
+    state_list = record.get('Location', '').split(", ")
+    state = state_list[1] if len(state_list) > 1 else ""
+    return state if len(state) == 2 else None
+
+class InjuryCube:
+    """Serious and fatal injury counts held as a month x state x measure array
+
+    Months run from first_year-01 onward and the array grows when a later
+    record arrives. The state axis holds the two-letter US states, plus one
+    catch-all slot (OTHER) for accidents outside the US or without a
+    parseable state. Each accident counts once. add() folds in newly
+    appended records, so the cube never needs a rescan. Queries are array
+    slices.
+
+    Usage
+    ------
+
+    cube = InjuryCube.build("AviationData.txt")
+    cube.total('Fatal Injury', state='CA', start=(1995, 1), end=(2000, 12))
+    cube.add(new_records)
+    """
+    OTHER = '--'
+
+    def __init__(self, first_year=1948):
+        self.first_year = first_year
+        self.states = {self.OTHER: 0}
+        self.counts = np.zeros((12, 8, len(MEASURES)), dtype=np.int64)
+        self.accidents = np.zeros((12, 8), dtype=np.int64)
+        self.skipped = 0
+
+    @classmethod
+    def build(cls, filename="AviationData.txt", first_year=1948):
+        cube = cls(first_year)
+        cube.add(iter_records(filename))
+        return cube
+
+    def month_index(self, year, month):
+        return (year - self.first_year) * 12 + month - 1
+
+    def state_index(self, state):
+        if state not in self.states:
+            self.states[state] = len(self.states)
+        return self.states[state]
+
+    def grow(self, months, states):
+        new_months = max(months, self.counts.shape[0])
+        new_states = max(states, self.counts.shape[1])
+        if (new_months, new_states) == self.counts.shape[:2]:
+            return
+        #Double the array size so repeated appends stay amortised O(1)
+        if new_months > self.counts.shape[0]:
+            new_months = max(new_months, 2 * self.counts.shape[0])
+        if new_states > self.counts.shape[1]:
+            new_states = max(new_states, 2 * self.counts.shape[1])
+        counts = np.zeros((new_months, new_states, len(MEASURES)), dtype=np.int64)
+        accidents = np.zeros((new_months, new_states), dtype=np.int64)
+        old_months, old_states = self.accidents.shape
+        counts[:old_months, :old_states] = self.counts
+        accidents[:old_months, :old_states] = self.accidents
+        self.counts = counts
+        self.accidents = accidents
+
+    def add(self, records):
+        """Fold records (dicts like read.py's) into the cube, buffering into arrays"""
+        months = []
+        states = []
+        values = []
+        for record in records:
+            parsed = parse_month(record.get('Event Date', ''))
+            if parsed is None or parsed[0] < self.first_year:
+                self.skipped += 1
+                continue
+            state = parse_state(record)
+            months.append(self.month_index(*parsed))
+            states.append(self.state_index(state if state is not None else self.OTHER))
+            values.append((to_int(record.get('Total Serious Injuries')),
+                           to_int(record.get('Total Fatal Injuries'))))
+        if not months:
+            return self
+        months = np.array(months)
+        states = np.array(states)
+        self.grow(months.max() + 1, len(self.states))
+        np.add.at(self.counts, (months, states), np.array(values, dtype=np.int64))
+        np.add.at(self.accidents, (months, states), 1)
+        return self
+
+    def month_range(self, start, end):
+        lo = 0 if start is None else max(self.month_index(*start), 0)
+        hi = self.counts.shape[0] if end is None else self.month_index(*end) + 1
+        return slice(lo, max(lo, hi))
+
+    def state_slice(self, state):
+        if state is None:
+            return slice(None)
+        if state not in self.states:
+            return slice(0, 0)
+        column = self.states[state]
+        return slice(column, column + 1)
+
+    def total(self, measure, state=None, start=None, end=None):
+        """Sum of a measure over a state (all if None) and an inclusive (year, month) range"""
+        block = self.counts[self.month_range(start, end), self.state_slice(state), MEASURES.index(measure)]
+        return int(block.sum())
+
+    def series(self, measure, state=None, start=None, end=None):
+        """Monthly totals of a measure as a 1-D array over the month range"""
+        block = self.counts[self.month_range(start, end), self.state_slice(state), MEASURES.index(measure)]
+        return block.sum(axis=1)
+
+    def by_state(self, measure, start=None, end=None):
+        block = self.counts[self.month_range(start, end), :len(self.states), MEASURES.index(measure)]
+        totals = block.sum(axis=0)
+        return {state: int(totals[column]) for state, column in self.states.items()}
+
+    def monthly_injuries(self):
+        """MM/YYYY -> {'Serious Injury', 'Fatal Injury'} for every month with an accident"""
+        per_month = self.counts.sum(axis=1)
+        active = np.nonzero(self.accidents.sum(axis=1))[0]
+        return {"{0:02d}/{1}".format(index % 12 + 1, self.first_year + index // 12):
+                {'Serious Injury': int(per_month[index, 0]), 'Fatal Injury': int(per_month[index, 1])}
+                for index in active}
@@ -0,0 +1,77 @@
+import bisect
+import pickle
+from records import iter_records
+
+def load_records(filename="AviationData.txt"):
+    """Read AviationData.txt into a list of dicts, one per accident, like read.py"""
+    return list(iter_records(filename))
+
+def date_key(event_date):
+    #MM/DD/YYYY -> YYYYMMDD so dates sort as strings, None if malformed
+    split_date = event_date.split('/')
+    if len(split_date) != 3 or len(split_date[2]) != 4:
+        return None
+    return split_date[2] + split_date[0].zfill(2) + split_date[1].zfill(2)
+
+class AccidentIndex:
+    """Hash indexes on Accident Number, Country and Location plus a sorted Event Date index
+
+    Point lookups are dict hits, O(1). Event Date ranges are two bisections
+    into the sorted keys, O(log n), plus the rows returned. Every lookup
+    returns a list of records, like the lax_code searches in read.py.
+
+    Usage
+    ------
+
+    index = AccidentIndex(load_records())
+    index.lookup('LAX94LA336')
+    index.between('01/01/1995', '12/31/2000')
+    index.save('AviationData.idx')
+    """
+    def __init__(self, records):
+        self.records = records
+        self.by_accident = {}
+        self.by_country = {}
+        self.by_location = {}
+        dated = []
+        for row, record in enumerate(records):
+            self.by_accident.setdefault(record.get('Accident Number'), []).append(row)
+            self.by_country.setdefault(record.get('Country'), []).append(row)
+            self.by_location.setdefault(record.get('Location'), []).append(row)
+            key = date_key(record.get('Event Date', ''))
+            if key is not None:
+                dated.append((key, row))
+        dated.sort()
+        self.date_keys = [key for key, row in dated]
+        self.date_rows = [row for key, row in dated]
+
+    def rows(self, positions):
+        return [self.records[row] for row in positions]
+
+    def lookup(self, accident_number):
+        return self.rows(self.by_accident.get(accident_number, []))
+
+    def country(self, name):
+        return self.rows(self.by_country.get(name, []))
+
+    def location(self, name):
+        return self.rows(self.by_location.get(name, []))
+
+    def between(self, start, end):
+        """Accidents with start <= Event Date <= end, both MM/DD/YYYY, in date order"""
+        bounds = [date_key(bound) if isinstance(bound, str) else None for bound in (start, end)]
+        for bound, key in zip((start, end), bounds):
+            if key is None:
+                raise ValueError("expected a date as MM/DD/YYYY, not {0!r}".format(bound))
+        lo = bisect.bisect_left(self.date_keys, bounds[0])
+        hi = bisect.bisect_right(self.date_keys, bounds[1])
+        return self.rows(self.date_rows[lo:hi])
+
+    def save(self, filename):
+        with open(filename, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(filename):
+        with open(filename, "rb") as f:
+            return pickle.load(f)
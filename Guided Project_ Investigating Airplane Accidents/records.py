@@ -0,0 +1,91 @@
+from collections import Counter
+
+DELIMITER = " | "
+
+def split_line(line):
+    #Rows end with a trailing " | " (sometimes without the final space); drop it
+    #so the last real column isn't followed by an empty one
+    line = line.rstrip("\r\n")
+    stripped = line.rstrip()
+    if stripped.endswith(" |"):
+        line = stripped[:-2]
+    elif stripped == "|":
+        line = ""
+    return line.split(DELIMITER)
+
+def read_rows(filename="AviationData.txt", buffer_size=1 << 20):
+    """Return the column names and a generator over each non-blank row's fields
+
+    The file is read one buffered line at a time. Ragged rows are yielded as
+    they are, shorter or longer than the header.
+
+    Usage
+    ------
+
+    names, rows = read_rows()
+    for split in rows:
+        ...
+    """
+    f = open(filename, "r", buffering=buffer_size)
+    names = split_line(f.readline())
+    def rows():
+        with f:
+            for line in f:
+                if line.strip():
+                    yield split_line(line)
+    return names, rows()
+
+def iter_records(filename="AviationData.txt", buffer_size=1 << 20):
+    """Yield one dict per accident without holding the file in memory
+
+    Like the dicts in read.py, a ragged row only has keys for the fields it
+    actually has, and fields past the last header column are dropped.
+    """
+    names, rows = read_rows(filename, buffer_size)
+    for split in rows:
+        yield dict(zip(names, split))
+
+def state_counts(records):
+    """Counter of two-letter states for United States accidents, in one pass"""
+    state_accidents = Counter()
+    for record in records:
+        if record.get('Country') == 'United States':
+            state_list = record.get('Location', '').split(", ")
+            state = state_list[1] if len(state_list) > 1 else ""
+            if len(state) == 2:
+                state_accidents[state] += 1
+    return state_accidents
+
+def to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+def monthly_injuries(records):
+    """MM/YYYY -> serious and fatal injury totals, in one pass
+
+    Gives the same totals as read.py, where a month's first accident seeds
+    the totals and is then added once more.
+    """
+    monthly_injuries = {}
+    for record in records:
+        if 'Event Date' not in record:
+            continue
+        split_date = record['Event Date'].split('/')
+        if len(split_date) < 3:
+            continue
+        month = split_date[0] + '/' + split_date[2]
+        if len(month) != 7:
+            continue
+        s_injury = to_int(record.get('Total Serious Injuries'))
+        f_injury = to_int(record.get('Total Fatal Injuries'))
+        if month not in monthly_injuries:
+            monthly_injuries[month] = {'Serious Injury': s_injury, 'Fatal Injury': f_injury}
+        monthly_injuries[month]['Serious Injury'] += s_injury
+        monthly_injuries[month]['Fatal Injury'] += f_injury
+    return monthly_injuries
+
+if __name__ == "__main__":
+    print(state_counts(iter_records()))
+    print(monthly_injuries(iter_records()))
@@ -13,10 +13,14 @@
 
 
 import pandas as pd
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 pd.options.display.max_columns = 100  # Avoid having displayed truncated output
 
-previous = pd.read_csv('fandango_score_comparison.csv')
-after = pd.read_csv('movie_ratings_16_17.csv')
+previous = csv_cache.read_csv('fandango_score_comparison.csv')
+after = csv_cache.read_csv('movie_ratings_16_17.csv')
 
 previous.head(3)
 
@@ -84,8 +84,12 @@ one_ticket_probability(test_input_2)
 
 
 import pandas as pd
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 
-lottery_canada = pd.read_csv('649.csv')
+lottery_canada = csv_cache.read_csv('649.csv')
 lottery_canada.shape
 
 
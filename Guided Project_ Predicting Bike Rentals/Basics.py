@@ -5,8 +5,12 @@
 
 
 import pandas
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 
-bike_rentals = pandas.read_csv("bike_rental_hour.csv")
+bike_rentals = csv_cache.read_csv("bike_rental_hour.csv")
 bike_rentals.head()
 
 
@@ -7,6 +7,10 @@
 
 
 import pandas as pd
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 import numpy as np
 
 pd.options.display.max_columns = 99
@@ -18,7 +22,7 @@ pd.options.display.max_columns = 99
 cols = ['symboling', 'normalized-losses', 'make', 'fuel-type', 'aspiration', 'num-of-doors', 'body-style', 
         'drive-wheels', 'engine-location', 'wheel-base', 'length', 'width', 'height', 'curb-weight', 'engine-type', 
         'num-of-cylinders', 'engine-size', 'fuel-system', 'bore', 'stroke', 'compression-rate', 'horsepower', 'peak-rpm', 'city-mpg', 'highway-mpg', 'price']
-cars = pd.read_csv('imports-85.data', names=cols)
+cars = csv_cache.read_csv('imports-85.data', names=cols)
 
 
 # In[3]:
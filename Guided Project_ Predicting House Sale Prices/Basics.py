@@ -7,6 +7,10 @@
 
 
 import pandas as pd
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 pd.options.display.max_columns = 999
 import numpy as np
 import matplotlib.pyplot as plt
@@ -20,7 +24,7 @@ from sklearn.model_selection import KFold
 # In[2]:
 
 
-df = pd.read_csv("AmesHousing.tsv", delimiter="\t")
+df = csv_cache.read_csv("AmesHousing.tsv", delimiter="\t")
 
 
 # In[3]:
@@ -233,7 +237,7 @@ def train_and_test(df):
     
     return rmse
 
-df = pd.read_csv("AmesHousing.tsv", delimiter="\t")
+df = csv_cache.read_csv("AmesHousing.tsv", delimiter="\t")
 transform_df = transform_features(df)
 filtered_df = select_features(transform_df)
 rmse = train_and_test(filtered_df)
@@ -427,7 +431,7 @@ def train_and_test(df, k=0):
         avg_rmse = np.mean(rmse_values)
         return avg_rmse
 
-df = pd.read_csv("AmesHousing.tsv", delimiter="\t")
+df = csv_cache.read_csv("AmesHousing.tsv", delimiter="\t")
 transform_df = transform_features(df)
 filtered_df = select_features(transform_df)
 rmse = train_and_test(filtered_df, k=4)
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_squared_error
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
+from cleaning import transform_features, select_features
+from cv import feature_matrix, make_folds
+from gram import gram_cross_validate, leave_one_out
+
+#Repeated 10-fold CV and leave-one-out: the train_and_test KFold loop
+#(iloc copies and a LinearRegression fit per fold) against Gram downdating
+#Usage: python benchmark_gram.py [repeats] [loo_rows]
+repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+loo_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+df = csv_cache.read_csv("AmesHousing.tsv", delimiter="\t")
+filtered_df = select_features(transform_features(df)).reset_index(drop=True)
+features = filtered_df.select_dtypes(include=['integer', 'float']).columns.drop("SalePrice")
+folds = make_folds(len(filtered_df), k=10, repeats=repeats, random_state=1)
+
+begin = time.perf_counter()
+loop_rmse = []
+for repeat, fold, test_index in folds:
+    train = filtered_df.drop(test_index)
+    test = filtered_df.iloc[test_index]
+    lr = LinearRegression()
+    lr.fit(train[features], train["SalePrice"])
+    predictions = lr.predict(test[features])
+    loop_rmse.append(np.sqrt(mean_squared_error(test["SalePrice"], predictions)))
+loop_time = time.perf_counter() - begin
+
+begin = time.perf_counter()
+results, avg_rmse = gram_cross_validate(filtered_df, k=10, repeats=repeats, random_state=1)
+gram_time = time.perf_counter() - begin
+
+print("10-fold x {0} repeats ({1} folds, {2} rows, {3} features)".format(
+    repeats, len(folds), len(filtered_df), len(features)))
+print("KFold loop: {0:.3f}s, mean RMSE {1:.4f}".format(loop_time, np.mean(loop_rmse)))
+print("Gram downdate: {0:.3f}s, mean RMSE {1:.4f}".format(gram_time, avg_rmse))
+print("speedup: {0:.1f}x".format(loop_time / gram_time))
+print("max relative fold RMSE difference: {0:.2e}".format(
+    np.max(np.abs(results.rmse.values - loop_rmse) / np.array(loop_rmse))))
+
+#Leave-one-out by refitting is one fit per row, so only time the first loo_rows
+X, y, _ = feature_matrix(filtered_df)
+begin = time.perf_counter()
+refit_errors = []
+for row in range(loo_rows):
+    train = np.arange(len(y)) != row
+    lr = LinearRegression().fit(X[train], y[train])
+    refit_errors.append(y[row] - lr.predict(X[row:row + 1])[0])
+refit_time = time.perf_counter() - begin
+
+begin = time.perf_counter()
+loo_rmse, errors = leave_one_out(filtered_df)
+closed_time = time.perf_counter() - begin
+
+print("\nleave-one-out")
+print("refit loop, {0} rows: {1:.3f}s (~{2:.1f}s for all {3})".format(
+    loo_rows, refit_time, refit_time * len(y) / loo_rows, len(y)))
+print("closed form, all {0} rows: {1:.3f}s, RMSE {2:.4f}".format(len(y), closed_time, loo_rmse))
+print("max relative error difference: {0:.2e}".format(
+    np.max(np.abs(errors[:loo_rows] - refit_errors) / np.maximum(np.abs(refit_errors), 1e-12))))
@@ -0,0 +1,120 @@
+import os
+import sys
+import time
+import pandas as pd
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
+
+NOMINAL_FEATURES = ["PID", "MS SubClass", "MS Zoning", "Street", "Alley", "Land Contour", "Lot Config", "Neighborhood",
+                    "Condition 1", "Condition 2", "Bldg Type", "House Style", "Roof Style", "Roof Matl", "Exterior 1st",
+                    "Exterior 2nd", "Mas Vnr Type", "Foundation", "Heating", "Central Air", "Garage Type",
+                    "Misc Feature", "Sale Type", "Sale Condition"]
+DROP_COLUMNS = ["PID", "Order", "Mo Sold", "Sale Condition", "Sale Type", "Year Built", "Year Remod/Add"]
+
+class CleaningPlan:
+    """transform_features from Basics.py, decided once and applied in one projection
+
+    fit() takes one null-count pass and reads the dtypes from the frame's
+    metadata. From those it decides which columns to drop (more than 5%
+    missing, or text with any missing) and the mode to fill in for numeric
+    columns with a few gaps. transform() derives Years Before Sale and
+    Years Since Remod first. It then takes the rows where neither is
+    negative and the kept columns in one .loc, and fills the gaps on that
+    copy, instead of the chain of full-frame copies. Seconds spent in each
+    stage go in timings_.
+
+    Usage
+    ------
+
+    plan = CleaningPlan().fit(df)
+    transform_df = plan.transform(df)
+    plan.timings_
+    """
+    def __init__(self, missing_threshold=0.05, drop_columns=DROP_COLUMNS):
+        self.missing_threshold = missing_threshold
+        self.drop_columns = list(drop_columns)
+        self.timings_ = {}
+
+    def time_stage(self, stage, start):
+        self.timings_[stage] = time.perf_counter() - start
+        return time.perf_counter()
+
+    def fit(self, df):
+        start = time.perf_counter()
+        num_missing = df.isnull().sum()
+        start = self.time_stage("nulls", start)
+
+        # select_dtypes on an empty slice gives the same column sets without copying any data
+        empty = df.iloc[:0]
+        limit = len(df) * self.missing_threshold
+        too_sparse = set(num_missing.index[num_missing > limit])
+        text = set(col for col, dtype in df.dtypes.items() if pd.api.types.is_string_dtype(dtype))
+        numeric = set(empty.select_dtypes(include=['int', 'float']).columns)
+        self.drop_missing_ = [col for col in df.columns
+                              if col in too_sparse or (col in text and num_missing[col] > 0)]
+        fixable = [col for col in df.columns
+                   if col in numeric and col not in too_sparse and 0 < num_missing[col] < limit]
+        self.fill_values_ = df[fixable].mode().to_dict(orient='records')[0] if fixable else {}
+
+        dropped = set(self.drop_missing_) | set(self.drop_columns)
+        self.columns_ = [col for col in df.columns if col not in dropped]
+        start = self.time_stage("plan", start)
+        return self
+
+    def transform(self, df):
+        start = time.perf_counter()
+        year_built = df['Year Built']
+        year_remod = df['Year Remod/Add']
+        if 'Year Built' in self.fill_values_:
+            year_built = year_built.fillna(self.fill_values_['Year Built'])
+        if 'Year Remod/Add' in self.fill_values_:
+            year_remod = year_remod.fillna(self.fill_values_['Year Remod/Add'])
+        years_sold = df['Yr Sold'] - year_built
+        years_since_remod = df['Yr Sold'] - year_remod
+        keep = ((years_sold >= 0) & (years_since_remod >= 0)).to_numpy()
+        start = self.time_stage("features", start)
+
+        # The only copy of the data: kept rows and kept columns in one take
+        out = df.loc[keep, self.columns_]
+        start = self.time_stage("project", start)
+
+        fills = {col: value for col, value in self.fill_values_.items() if col in out.columns}
+        if fills:
+            out[list(fills)] = out[list(fills)].fillna(fills)
+        out['Years Before Sale'] = years_sold[keep]
+        out['Years Since Remod'] = years_since_remod[keep]
+        self.time_stage("fill", start)
+        return out
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
+
+def transform_features(df):
+    """Same output as Basics.transform_features, through a CleaningPlan"""
+    return CleaningPlan().fit_transform(df)
+
+def select_features(df, coeff_threshold=0.4, uniq_threshold=10):
+    """Basics.select_features, importable without running the notebook script"""
+    numerical_df = df.select_dtypes(include=['int', 'float'])
+    abs_corr_coeffs = numerical_df.corr()['SalePrice'].abs().sort_values()
+    df = df.drop(abs_corr_coeffs[abs_corr_coeffs < coeff_threshold].index, axis=1)
+
+    transform_cat_cols = [col for col in NOMINAL_FEATURES if col in df.columns]
+    uniqueness_counts = df[transform_cat_cols].apply(lambda col: len(col.value_counts())).sort_values()
+    drop_nonuniq_cols = uniqueness_counts[uniqueness_counts > uniq_threshold].index
+    df = df.drop(drop_nonuniq_cols, axis=1)
+
+    text_cols = df.select_dtypes(include=['object'])
+    for col in text_cols:
+        df[col] = df[col].astype('category')
+    df = pd.concat([df, pd.get_dummies(df.select_dtypes(include=['category']))], axis=1).drop(text_cols,axis=1)
+
+    return df
+
+if __name__ == "__main__":
+    df = csv_cache.read_csv("AmesHousing.tsv", delimiter="\t")
+    plan = CleaningPlan()
+    transform_df = plan.fit_transform(df)
+    print(transform_df.shape)
+    for stage, seconds in plan.timings_.items():
+        print("{}: {:.4f}s".format(stage, seconds))
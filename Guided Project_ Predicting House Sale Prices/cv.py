@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from sklearn.linear_model import LinearRegression
+from sklearn.model_selection import KFold
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
+
+#Arrays attached from shared memory once per worker process and only read by folds
+shared = {}
+
+def feature_matrix(df, target="SalePrice"):
+    """The columns train_and_test fits on, as contiguous float64 arrays
+
+    Same selection as train_and_test: integer and float columns except the
+    target (bool dummy columns are left out, as there).
+    """
+    numeric_df = df.iloc[:0].select_dtypes(include=['integer', 'float'])
+    features = numeric_df.columns.drop(target)
+    X = np.ascontiguousarray(df[features].to_numpy(dtype=np.float64))
+    y = np.ascontiguousarray(df[target].to_numpy(dtype=np.float64))
+    return X, y, list(features)
+
+def make_folds(n_rows, k=4, repeats=1, random_state=None):
+    """(repeat, fold, test_index) for each of k shuffled folds, repeats times over"""
+    folds = []
+    rng = np.random.RandomState(random_state)
+    for repeat in range(repeats):
+        kf = KFold(n_splits=k, shuffle=True, random_state=rng.randint(np.iinfo(np.int32).max))
+        for fold, (train_index, test_index) in enumerate(kf.split(np.empty(n_rows))):
+            folds.append((repeat, fold, test_index))
+    return folds
+
+def share(arrays):
+    """Copy arrays into shared memory blocks; returns the blocks and how to attach them"""
+    blocks = []
+    specs = {}
+    for name, array in arrays.items():
+        block = SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+        blocks.append(block)
+        specs[name] = (block.name, array.shape, array.dtype.str)
+    return blocks, specs
+
+def init_worker(specs):
+    for name, (block_name, shape, dtype) in specs.items():
+        block = SharedMemory(name=block_name)
+        shared[name + '_block'] = block
+        shared[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+def use_arrays(X, y):
+    shared['X'] = X
+    shared['y'] = y
+
+def run_fold(fold):
+    repeat, fold_number, test_index = fold
+    X, y = shared['X'], shared['y']
+    start = time.perf_counter()
+    train_mask = np.ones(len(y), dtype=bool)
+    train_mask[test_index] = False
+    lr = LinearRegression()
+    lr.fit(X[train_mask], y[train_mask])
+    predictions = lr.predict(X[test_index])
+    rmse = np.sqrt(np.mean((y[test_index] - predictions) ** 2))
+    return {'repeat': repeat, 'fold': fold_number, 'test_rows': len(test_index),
+            'rmse': rmse, 'seconds': time.perf_counter() - start}
+
+def cross_validate(df, k=4, repeats=1, random_state=None, workers=None):
+    """k-fold (optionally repeated) CV of the linear model, folds run in parallel
+
+    The feature matrix is built once and placed in shared memory, so each
+    worker attaches to it instead of receiving a copy, and a fold only
+    ships its test row positions. Returns one row per fold with its RMSE and
+    fit/predict time, plus the mean RMSE as train_and_test(df, k) reports.
+    workers=1 runs the folds in this process.
+
+    Usage
+    ------
+
+    folds, avg_rmse = cross_validate(filtered_df, k=10, repeats=5)
+    """
+    if k < 2:
+        raise ValueError("k-fold CV needs k >= 2, not {0!r}".format(k))
+    X, y, _ = feature_matrix(df)
+    folds = make_folds(len(y), k, repeats, random_state)
+    if workers == 1:
+        use_arrays(X, y)
+        results = [run_fold(fold) for fold in folds]
+    else:
+        blocks, specs = share({'X': X, 'y': y})
+        try:
+            with Pool(workers, initializer=init_worker, initargs=(specs,)) as pool:
+                results = pool.map(run_fold, folds, chunksize=max(1, len(folds) // (4 * (workers or os.cpu_count()))))
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+    results = pd.DataFrame(results)
+    return results, results.rmse.mean()
+
+if __name__ == "__main__":
+    from cleaning import transform_features, select_features
+    df = csv_cache.read_csv("AmesHousing.tsv", delimiter="\t")
+    filtered_df = select_features(transform_features(df))
+    for workers in (1, None):
+        start = time.perf_counter()
+        results, avg_rmse = cross_validate(filtered_df, k=10, repeats=10, random_state=1, workers=workers)
+        print("workers={0}: {1} folds, mean RMSE {2:.2f}, fold time {3:.3f}s, wall time {4:.3f}s".format(
+            workers or os.cpu_count(), len(results), avg_rmse, results.seconds.sum(), time.perf_counter() - start))
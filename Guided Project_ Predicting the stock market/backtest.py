@@ -0,0 +1,117 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from multiprocessing import Pool
+from sklearn.linear_model import LinearRegression
+from features import FEATURES, add_features
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
+
+#Feature matrix and target, set once per worker process and only read by folds
+shared = {}
+
+def load(path='sphist.csv'):
+    df = csv_cache.read_csv(path)
+    df['DateTime'] = pd.to_datetime(df.Date)
+    df_ordered = add_features(df.sort_values('DateTime', ascending=True).reset_index(drop=True))
+    return df_ordered.dropna(axis=0).reset_index(drop=True)
+
+def make_folds(dates, first_test, retrain_every, window='expanding', train_rows=None):
+    """Split row positions into walk-forward (train, test) ranges
+
+    The model is refit every retrain_every rows starting at the first row on
+    or after first_test. An expanding window trains on every earlier row, a
+    sliding one on the previous train_rows rows only. A first_test before
+    the data starts is moved up to the first row with enough history; one
+    after the last row raises ValueError.
+    """
+    if window not in ('expanding', 'sliding'):
+        raise ValueError("window must be 'expanding' or 'sliding', not {0!r}".format(window))
+    if window == 'sliding' and not train_rows:
+        raise ValueError("a sliding window needs train_rows")
+    if retrain_every < 1:
+        raise ValueError("retrain_every must be at least 1, not {0!r}".format(retrain_every))
+    #At least one training row (train_rows for a sliding window) before the first test row
+    min_start = train_rows if window == 'sliding' else 1
+    if min_start >= len(dates):
+        raise ValueError("need more than {0} rows to backtest, have {1}".format(min_start, len(dates)))
+    start = max(int(np.searchsorted(dates, np.datetime64(first_test))), min_start)
+    if start >= len(dates):
+        raise ValueError("first_test {0} is after the last date; use a date from {1} to {2}".format(
+            first_test, np.datetime_as_string(dates[min_start], unit='D'),
+            np.datetime_as_string(dates[-1], unit='D')))
+    folds = []
+    for test_start in range(start, len(dates), retrain_every):
+        train_start = max(0, test_start - train_rows) if window == 'sliding' else 0
+        folds.append((train_start, test_start, min(test_start + retrain_every, len(dates))))
+    return folds
+
+def init_worker(X, y):
+    shared['X'] = X
+    shared['y'] = y
+
+def run_fold(fold):
+    train_start, test_start, test_end = fold
+    X, y = shared['X'], shared['y']
+    start = time.perf_counter()
+    model = LinearRegression()
+    model.fit(X[train_start:test_start], y[train_start:test_start])
+    pred = model.predict(X[test_start:test_end])
+    errors = np.abs(pred - y[test_start:test_end])
+    return {'train_start': train_start, 'test_start': test_start, 'test_end': test_end,
+            'mae': errors.mean(), 'abs_error_sum': errors.sum(),
+            'seconds': time.perf_counter() - start}
+
+def walk_forward(df, first_test='1960-01-01', retrain_every=21, window='expanding',
+                 train_rows=None, workers=None):
+    """Walk-forward backtest of the linear model over df
+
+    Returns one row per fold with its date range, MAE and fit/predict time,
+    plus the MAE over every test prediction.
+
+    Usage
+    ------
+
+    folds, mae = walk_forward(load(), retrain_every=5, window='sliding', train_rows=2520)
+    """
+    X = np.ascontiguousarray(df[FEATURES].values, dtype=np.float64)
+    y = np.ascontiguousarray(df.Close.values, dtype=np.float64)
+    dates = df.DateTime.values
+    folds = make_folds(dates, first_test, retrain_every, window, train_rows)
+    if workers == 1:
+        init_worker(X, y)
+        results = [run_fold(fold) for fold in folds]
+    else:
+        with Pool(workers, initializer=init_worker, initargs=(X, y)) as pool:
+            results = pool.map(run_fold, folds, chunksize=max(1, len(folds) // (4 * (workers or os.cpu_count()))))
+    results = pd.DataFrame(results)
+    results['train_from'] = dates[results.train_start]
+    results['test_from'] = dates[results.test_start]
+    results['test_to'] = dates[results.test_end - 1]
+    mae = results.abs_error_sum.sum() / (results.test_end - results.test_start).sum()
+    return results.drop('abs_error_sum', axis=1), mae
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Walk-forward backtest of predict.py')
+    parser.add_argument('--first-test', default='1960-01-01')
+    parser.add_argument('--retrain-every', type=int, default=21, help='rows between refits')
+    parser.add_argument('--window', choices=['expanding', 'sliding'], default='expanding')
+    parser.add_argument('--train-rows', type=int, help='training rows for a sliding window')
+    parser.add_argument('--workers', type=int, help='processes, defaults to every core')
+    args = parser.parse_args()
+    if args.window == 'sliding' and not args.train_rows:
+        parser.error('--window sliding needs --train-rows')
+
+    start = time.perf_counter()
+    try:
+        results, mae = walk_forward(load(), args.first_test, args.retrain_every, args.window,
+                                    args.train_rows, args.workers)
+    except ValueError as error:
+        parser.error(str(error))
+    print(results[['train_from', 'test_from', 'test_to', 'mae', 'seconds']].to_string(index=False))
+    print("folds: {0}".format(len(results)))
+    print("MAE: {0}".format(mae))
+    print("wall time: {0:.2f}s".format(time.perf_counter() - start))
@@ -0,0 +1,42 @@
+import sys
+import time
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from backtest import load
+from features import FEATURES
+from online import OnlineLinearRegression
+
+#Simulate daily retraining over the last `days` rows: a batch refit on all
+#history each day against one online update per day
+#Usage: python benchmark_online.py [days]
+days = int(sys.argv[1]) if len(sys.argv) > 1 else 250
+
+df = load()
+X = df[FEATURES].values
+y = df.Close.values
+start = len(y) - days
+
+batch_coefs = []
+begin = time.perf_counter()
+for end in range(start, len(y) + 1):
+    model = LinearRegression().fit(X[:end], y[:end])
+    batch_coefs.append(np.append(model.coef_, model.intercept_))
+batch_time = time.perf_counter() - begin
+
+online_coefs = []
+begin = time.perf_counter()
+online = OnlineLinearRegression().partial_fit(X[:start], y[:start])
+online_coefs.append(np.append(online.coef_, online.intercept_))
+for row in range(start, len(y)):
+    online.partial_fit(X[row:row + 1], y[row:row + 1])
+    online_coefs.append(np.append(online.coef_, online.intercept_))
+online_time = time.perf_counter() - begin
+
+batch_coefs = np.array(batch_coefs)
+online_coefs = np.array(online_coefs)
+scale = np.maximum(np.abs(batch_coefs), 1e-12)
+print("daily refits: {0} (history {1} rows)".format(days + 1, len(y)))
+print("batch LinearRegression: {0:.3f}s".format(batch_time))
+print("online update: {0:.3f}s".format(online_time))
+print("speedup: {0:.1f}x".format(batch_time / online_time))
+print("max relative coefficient difference: {0:.2e}".format((np.abs(batch_coefs - online_coefs) / scale).max()))
@@ -0,0 +1,99 @@
+import math
+from collections import deque
+
+FEATURES = ['data_mean_5day', 'data_mean_365day', 'data_mean_ratio', 'data_std_5day', 'data_std_365day', 'data_std_ratio']
+
+def add_features(df_ordered):
+    """Add the six rolling features to a frame of closes sorted by date
+
+    Each feature only uses closes up to the previous day.
+    """
+    close = df_ordered.Close
+    df_ordered['data_mean_5day'] = close.rolling(window=5).mean().shift(1)
+    df_ordered['data_mean_365day'] = close.rolling(window=365).mean().shift(1)
+    df_ordered['data_mean_ratio'] = df_ordered['data_mean_5day']/df_ordered['data_mean_365day']
+    df_ordered['data_std_5day'] = close.rolling(window=5).std().shift(1)
+    df_ordered['data_std_365day'] = close.rolling(window=365).std().shift(1)
+    df_ordered['data_std_ratio'] = df_ordered['data_std_5day']/df_ordered['data_std_365day']
+    return df_ordered
+
+class RollingStats:
+    """Mean and sample std over the last `window` values, updated in O(1)
+
+    Uses Welford's running mean/sum of squares, with a combined add-and-
+    remove step once the window is full, so each new value costs the same
+    however long the window is. Matches Series.rolling(window).mean()/.std().
+    """
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, value):
+        if len(self.values) < self.window:
+            self.values.append(value)
+            delta = value - self.mean
+            self.mean += delta / len(self.values)
+            self.m2 += delta * (value - self.mean)
+        else:
+            old = self.values.popleft()
+            self.values.append(value)
+            old_mean = self.mean
+            self.mean += (value - old) / self.window
+            self.m2 += (value - old) * (value - self.mean + old - old_mean)
+            if self.m2 < 0:
+                self.m2 = 0.0
+
+    def ready(self):
+        return len(self.values) == self.window
+
+    def std(self):
+        if self.window < 2 or not self.ready():
+            return float('nan')
+        return math.sqrt(self.m2 / (self.window - 1))
+
+class FeatureEngine:
+    """Incrementally maintained version of the six predict.py features
+
+    After append(close) for day t, features() returns the values predict.py
+    puts on day t+1 (its rolling stats are shifted by one day). Six features
+    cost O(1) per appended close instead of a pass over the whole history.
+
+    Usage
+    ------
+
+    engine = FeatureEngine.from_history(df_ordered.Close)
+    engine.append(todays_close)
+    engine.features()
+    """
+    def __init__(self, short=5, long=365):
+        self.short = RollingStats(short)
+        self.long = RollingStats(long)
+
+    @classmethod
+    def from_history(cls, closes, short=5, long=365):
+        engine = cls(short, long)
+        for close in closes:
+            engine.append(close)
+        return engine
+
+    def append(self, close):
+        close = float(close)
+        self.short.push(close)
+        self.long.push(close)
+
+    def features(self):
+        nan = float('nan')
+        mean_5day = self.short.mean if self.short.ready() else nan
+        mean_365day = self.long.mean if self.long.ready() else nan
+        std_5day = self.short.std()
+        std_365day = self.long.std()
+        return {
+            'data_mean_5day': mean_5day,
+            'data_mean_365day': mean_365day,
+            'data_mean_ratio': mean_5day / mean_365day if mean_365day else nan,
+            'data_std_5day': std_5day,
+            'data_std_365day': std_365day,
+            'data_std_ratio': std_5day / std_365day if std_365day else nan,
+        }
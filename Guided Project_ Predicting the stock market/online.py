@@ -0,0 +1,64 @@
+import numpy as np
+
+class OnlineLinearRegression:
+    """Least squares fit kept current from sufficient statistics
+
+    Holds the row count, feature/target means and the centred X^T X and
+    X^T y. New rows are merged in with Chan's pairwise update, so adding one
+    day is O(p^2) and refitting is a p x p solve, however much history has
+    been seen. Coefficients match LinearRegression().fit on all rows so far.
+
+    Usage
+    ------
+
+    model = OnlineLinearRegression().partial_fit(df_train[features], df_train.Close)
+    model.partial_fit(todays_row[features], todays_row.Close)
+    model.predict(X_test)
+    """
+    def __init__(self):
+        self.n = 0
+        self.mean_x = None
+        self.mean_y = 0.0
+        self.xx = None
+        self.xy = None
+        self.coef_ = None
+        self.intercept_ = None
+
+    def partial_fit(self, X, y):
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        y = np.asarray(y, dtype=np.float64).ravel()
+        m = len(y)
+        if m == 0:
+            return self
+        batch_mean_x = X.mean(axis=0)
+        batch_mean_y = y.mean()
+        centred_x = X - batch_mean_x
+        batch_xx = centred_x.T @ centred_x
+        batch_xy = centred_x.T @ (y - batch_mean_y)
+
+        if self.n == 0:
+            self.mean_x, self.mean_y = batch_mean_x, batch_mean_y
+            self.xx, self.xy = batch_xx, batch_xy
+        else:
+            total = self.n + m
+            dx = batch_mean_x - self.mean_x
+            dy = batch_mean_y - self.mean_y
+            weight = self.n * m / total
+            self.xx = self.xx + batch_xx + weight * np.outer(dx, dx)
+            self.xy = self.xy + batch_xy + weight * dx * dy
+            self.mean_x = self.mean_x + dx * m / total
+            self.mean_y = self.mean_y + dy * m / total
+        self.n += m
+        self.solve()
+        return self
+
+    def fit(self, X, y):
+        self.__init__()
+        return self.partial_fit(X, y)
+
+    def solve(self):
+        self.coef_ = np.linalg.lstsq(self.xx, self.xy, rcond=None)[0]
+        self.intercept_ = self.mean_y - self.mean_x @ self.coef_
+
+    def predict(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.coef_ + self.intercept_
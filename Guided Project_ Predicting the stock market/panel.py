@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+from features import FEATURES
+
+#Windows up to this length are computed exactly rather than from running sums
+DIRECT_WINDOW = 32
+
+def load_panel(paths, column='Close'):
+    """Stack one close column per ticker into a date x ticker frame
+
+    paths maps ticker -> CSV shaped like sphist.csv. Dates missing for a
+    ticker are NaN.
+
+    Usage
+    ------
+
+    closes = load_panel({'SPX': 'sphist.csv', 'AAPL': 'aapl.csv'})
+    """
+    series = {}
+    for ticker, path in paths.items():
+        df = pd.read_csv(path, usecols=['Date', column], parse_dates=['Date'])
+        series[ticker] = df.set_index('Date')[column].astype(np.float64)
+    return pd.DataFrame(series).sort_index()
+
+def panel_dates(paths):
+    """Every date any of the CSVs has, sorted; only the Date columns are read"""
+    dates = pd.DatetimeIndex([])
+    for path in paths.values():
+        dates = dates.union(pd.read_csv(path, usecols=['Date'], parse_dates=['Date'])['Date'])
+    return dates.rename('Date')
+
+def iter_panel(paths, column='Close', chunk=500):
+    """Yield load_panel frames of up to chunk tickers at a time, all on the same dates
+
+    Only one chunk of tickers is in memory at once, and every chunk has the
+    rows load_panel(paths) would, so features come out the same.
+    """
+    dates = panel_dates(paths)
+    tickers = list(paths)
+    for start in range(0, len(tickers), chunk):
+        block = load_panel({ticker: paths[ticker] for ticker in tickers[start:start + chunk]}, column)
+        yield block.reindex(dates)
+
+def rolling_mean_std(closes, window):
+    """Rolling mean and sample std down the rows of a 2-D float array
+
+    Short windows are summed directly from window shifted slices. Long
+    ones use cumulative sums of the values and their squares (shifted by the
+    first row for stability), so every column is done in one vectorised
+    pass. Rows before a full window, or windows holding a NaN, are NaN.
+    """
+    n = closes.shape[0]
+    mean = np.full(closes.shape, np.nan)
+    std = np.full(closes.shape, np.nan)
+    if n < window:
+        return mean, std
+    if window <= DIRECT_WINDOW:
+        rows = n - window + 1
+        total = closes[:rows].copy()
+        for k in range(1, window):
+            total += closes[k:k + rows]
+        window_mean = total / window
+        squares = np.zeros_like(window_mean)
+        for k in range(window):
+            deviation = closes[k:k + rows] - window_mean
+            squares += deviation * deviation
+        mean[window - 1:] = window_mean
+        std[window - 1:] = np.sqrt(squares / (window - 1))
+        return mean, std
+    base = np.nan_to_num(closes[:1])
+    shifted = closes - base
+    missing = np.isnan(shifted)
+    shifted = np.where(missing, 0.0, shifted)
+    zeros = np.zeros((1, closes.shape[1]))
+    sums = np.concatenate([zeros, np.cumsum(shifted, axis=0)])
+    squares = np.concatenate([zeros, np.cumsum(shifted * shifted, axis=0)])
+    gaps = np.concatenate([zeros, np.cumsum(missing, axis=0)])
+    window_sum = sums[window:] - sums[:-window]
+    window_squares = squares[window:] - squares[:-window]
+    window_gaps = gaps[window:] - gaps[:-window]
+    window_mean = window_sum / window
+    variance = (window_squares - window_sum * window_mean) / (window - 1)
+    window_mean += base
+    window_std = np.sqrt(np.maximum(variance, 0.0))
+    window_mean[window_gaps > 0] = np.nan
+    window_std[window_gaps > 0] = np.nan
+    mean[window - 1:] = window_mean
+    std[window - 1:] = window_std
+    return mean, std
+
+def shift_down(values):
+    shifted = np.empty_like(values)
+    shifted[0] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+def block_features(block, short=5, long=365):
+    """The six features for one date x ticker frame, as frames shaped like it"""
+    values = np.ascontiguousarray(block.to_numpy(dtype=np.float64))
+    mean_5day, std_5day = rolling_mean_std(values, short)
+    mean_365day, std_365day = rolling_mean_std(values, long)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = {
+            'data_mean_5day': shift_down(mean_5day),
+            'data_mean_365day': shift_down(mean_365day),
+            'data_mean_ratio': shift_down(mean_5day / mean_365day),
+            'data_std_5day': shift_down(std_5day),
+            'data_std_365day': shift_down(std_365day),
+            'data_std_ratio': shift_down(std_5day / std_365day),
+        }
+    return {name: pd.DataFrame(result[name], index=block.index, columns=block.columns)
+            for name in FEATURES}
+
+def iter_panel_features(closes, short=5, long=365, chunk=500):
+    """Yield the six predict.py features chunk tickers at a time
+
+    closes is a date x ticker frame, or an iterable of them such as
+    iter_panel(paths). Each step yields a dict of feature name -> date x
+    ticker frame for one chunk, shifted one day like predict.py, so memory
+    holds one chunk's closes and features at a time; consume or write each
+    one out before the next.
+
+    Usage
+    ------
+
+    for features in iter_panel_features(iter_panel(paths)):
+        features['data_std_ratio'].iloc[-1]
+    """
+    if isinstance(closes, pd.DataFrame):
+        blocks = (closes.iloc[:, start:start + chunk] for start in range(0, closes.shape[1], chunk))
+    else:
+        blocks = closes
+    for block in blocks:
+        yield block_features(block, short, long)
+
+def panel_features(closes, short=5, long=365, chunk=500):
+    """All six features for every ticker in closes as full date x ticker frames
+
+    Holds every output at once, about six times the panel; for large panels
+    use iter_panel_features instead.
+
+    Usage
+    ------
+
+    features = panel_features(load_panel(paths))
+    features['data_std_ratio']['AAPL']
+    """
+    chunks = list(iter_panel_features(closes, short, long, chunk))
+    return {name: pd.concat([features[name] for features in chunks], axis=1) for name in FEATURES}
+
+if __name__ == "__main__":
+    #Usage: python panel.py sphist.csv other.csv ... (ticker = file name)
+    import os
+    import sys
+    paths = {os.path.splitext(os.path.basename(path))[0]: path for path in sys.argv[1:]}
+    latest = [pd.DataFrame({name: frame.iloc[-1] for name, frame in features.items()})
+              for features in iter_panel_features(iter_panel(paths))]
+    print(pd.concat(latest))
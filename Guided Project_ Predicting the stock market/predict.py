@@ -1,30 +1,22 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from features import FEATURES, FeatureEngine, add_features
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 
-df = pd.read_csv('sphist.csv')
+df = csv_cache.read_csv('sphist.csv')
 df['DateTime'] = pd.to_datetime(df.Date)
-df_ordered = df.sort('DateTime', ascending=True)
+df_ordered = df.sort_values('DateTime', ascending=True)
 df_ordered['index'] = range(0,df.shape[0],1)
 df_ordered.set_index(['index'])
 
 
 df_ordered['date_after_april1_2015'] = df_ordered.DateTime > datetime(year=2015, month=4, day=1)
 
-data_mean_5day = pd.rolling_mean(df_ordered.Close, window=5).shift(1)
-data_mean_365day = pd.rolling_mean(df_ordered.Close, window=365).shift(1)
-data_mean_ratio = data_mean_5day/data_mean_365day
-
-data_std_5day = pd.rolling_std(df_ordered.Close, window=5).shift(1)
-data_std_365day = pd.rolling_std(df_ordered.Close, window=365).shift(1)
-data_std_ratio = data_std_5day/data_std_365day
-
-df_ordered['data_mean_5day'] = data_mean_5day
-df_ordered['data_mean_365day'] = data_mean_365day
-df_ordered['data_mean_ratio'] = data_mean_ratio
-df_ordered['data_std_5day'] = data_std_5day
-df_ordered['data_std_365day'] = data_std_365day
-df_ordered['data_std_ratio'] = data_std_ratio
+df_ordered = add_features(df_ordered)
 
 df_new = df_ordered[df_ordered["DateTime"] > datetime(year=1951, month=1, day=2)]
 df_no_NA = df_new.dropna(axis=0)
@@ -34,7 +26,7 @@ df_test = df_no_NA[df_no_NA['DateTime'] >= datetime(year=2013, month=1, day=1)]
 
 from sklearn.linear_model import LinearRegression
 model = LinearRegression()
-features = ['data_mean_5day', 'data_mean_365day', 'data_mean_ratio', 'data_std_5day', 'data_std_365day', 'data_std_ratio']
+features = FEATURES
 X = df_train[features]
 X_test = df_test[features]
 y = df_train.Close
@@ -45,4 +37,9 @@ pred = model.predict(X_test)
 
 MAE = sum(abs(pred - y_test))/len(pred)
 print(MAE)
-print(model.score(X, y))
\ No newline at end of file
+print(model.score(X, y))
+
+#Features for the next trading day, kept up to date one close at a time
+engine = FeatureEngine.from_history(df_ordered.Close)
+next_day = pd.DataFrame([engine.features()])[features]
+print(model.predict(next_day))
\ No newline at end of file
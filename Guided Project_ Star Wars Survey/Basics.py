@@ -7,7 +7,11 @@
 
 
 import pandas as pd
-star_wars = pd.read_csv('star_wars.csv', encoding='ISO-8859-1')
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
+star_wars = csv_cache.read_csv('star_wars.csv', encoding='ISO-8859-1')
 
 
 # In[2]:
@@ -0,0 +1,28 @@
+import sys
+import time
+import pandas as pd
+import read
+import times
+
+#Compare per-row dateutil parsing with the bulk parser on a million timestamps
+#Usage: python benchmark_times.py [rows]
+rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+sample = read.load_data(columns=['submission_time'])['submission_time']
+repeats = rows // len(sample) + 1
+column = pd.concat([sample] * repeats, ignore_index=True)[:rows]
+
+start = time.perf_counter()
+per_row = column.apply(times.hour_extract)
+per_row_time = time.perf_counter() - start
+
+times.formats.clear()
+start = time.perf_counter()
+bulk = times.hours_extract(column)
+bulk_time = time.perf_counter() - start
+
+print("rows: {0}".format(rows))
+print("dateutil parse per row: {0:.2f}s".format(per_row_time))
+print("bulk to_datetime: {0:.2f}s".format(bulk_time))
+print("speedup: {0:.1f}x".format(per_row_time / bulk_time))
+print("identical hours: {0}".format(per_row.equals(bulk)))
@@ -1,12 +1,140 @@
+import os
+import sys
 import read
 from collections import Counter
-data = read.load_data()
+from multiprocessing import Pool
 
-data_headlines = data["headline"]
-string_headlines = ""
-for string in data_headlines:
-    string_headlines+=str(string)+" "
-split_lowered = string_headlines.lower().split(' ')
+def tokenize(headlines):
+    """Yield lowercased words one headline at a time
 
-common = Counter(split_lowered).most_common(100)  
-print(common)
\ No newline at end of file
+    Matches the old build-one-string-and-split behaviour, including the
+    empty words that come from doubled or leading spaces, except for the
+    single empty word its trailing space added; report() adds that one.
+    """
+    for string in headlines:
+        for word in str(string).lower().split(' '):
+            yield word
+
+class SpaceSaving:
+    """Bounded-memory approximate top-K counter (Metwally et al. Space-Saving)
+
+    Tracks at most capacity words. When a new word arrives and the table is
+    full, it replaces the word with the smallest count and inherits that
+    count, so any word with true frequency above total/capacity is kept and
+    counts overestimate by at most total/capacity.
+
+    Usage
+    ------
+
+    counter = SpaceSaving(1000)
+    counter.update(tokenize(headlines))
+    counter.most_common(100)
+    """
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        #count -> words holding that count, so the minimum is found in O(1)
+        self.buckets = {}
+        self.minimum = 0
+
+    def _move(self, word, old, new):
+        if old:
+            bucket = self.buckets[old]
+            bucket.discard(word)
+            if not bucket:
+                del self.buckets[old]
+                if old == self.minimum:
+                    self.minimum = new
+        self.buckets.setdefault(new, set()).add(word)
+        self.counts[word] = new
+
+    def update(self, words):
+        counts = self.counts
+        for word in words:
+            if word in counts:
+                self._move(word, counts[word], counts[word] + 1)
+            elif len(counts) < self.capacity:
+                self.errors[word] = 0
+                self._move(word, 0, 1)
+                self.minimum = 1
+            else:
+                floor = self.minimum
+                victim = next(iter(self.buckets[floor]))
+                self.buckets[floor].discard(victim)
+                del counts[victim]
+                del self.errors[victim]
+                self.buckets[floor].add(word)
+                self.errors[word] = floor
+                self._move(word, floor, floor + 1)
+
+    def most_common(self, n=None):
+        return Counter(self.counts).most_common(n)
+
+def count_chunk(counter, chunk):
+    counter.update(tokenize(chunk["headline"]))
+    return counter
+
+def report(counter):
+    #The old joined string ended with a space, so its split ended with one more ''
+    counter.update([''])
+    common = counter.most_common(100)
+    print(common)
+
+def shard_ranges(path, workers):
+    size = os.path.getsize(path)
+    step = size // workers + 1
+    return [(path, start, min(start + step, size)) for start in range(0, size, step)]
+
+def count_shard(shard):
+    """Count the headline words of every line that starts inside [start, end)
+
+    Records are assumed not to contain embedded newlines, which holds for
+    the HN dumps. The first line of the file is the header row pandas skips.
+    """
+    path, start, end = shard
+    counter = Counter()
+    with open(path, 'rb') as f:
+        if start:
+            f.seek(start - 1)
+        f.readline()
+        position = f.tell()
+        lines = []
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            lines.append(line)
+            position += len(line)
+            if len(lines) == read.CHUNKSIZE:
+                count_chunk(counter, read.parse_lines(lines, ['headline']))
+                lines = []
+        if lines:
+            count_chunk(counter, read.parse_lines(lines, ['headline']))
+    return counter
+
+def count_parallel(path, workers):
+    """Shard path by byte ranges, count each shard in a process pool and merge
+
+    Shards are merged in file order so ties in most_common come out in the
+    same order as a single-process count.
+    """
+    with Pool(workers) as pool:
+        partials = pool.map(count_shard, shard_ranges(path, workers))
+    counter = Counter()
+    for partial in partials:
+        counter.update(partial)
+    return counter
+
+if __name__ == "__main__":
+    #Pass --top-k N to count with a bounded SpaceSaving table of N words
+    #Pass --workers N to count byte-range shards of the file in N processes
+    if '--workers' in sys.argv:
+        report(count_parallel('hn_stories.csv', int(sys.argv[sys.argv.index('--workers') + 1])))
+    else:
+        if '--top-k' in sys.argv:
+            counter = SpaceSaving(int(sys.argv[sys.argv.index('--top-k') + 1]))
+        else:
+            counter = Counter()
+        chunks = read.load_data(chunksize=read.CHUNKSIZE, columns=['headline'])
+        report(read.fold(chunks, count_chunk, counter))
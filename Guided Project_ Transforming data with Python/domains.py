@@ -1,8 +1,180 @@
+import os
+import sys
+import json
+import tempfile
+import ipaddress
 import read
-data = read.load_data()
+import numpy as np
+import pandas as pd
+from functools import lru_cache
 
-domains = data['url'].value_counts(sort = True, ascending = False)
-domains = domains[0:99:] #shows 100 items
-for name, row in domains.items():
-    print("{0}: {1}".format(name, row))
-    
\ No newline at end of file
+#Second-level labels that sit under a country code TLD, e.g. co.uk, com.au, edu.tr
+COUNTRY_SLDS = {'ac', 'co', 'com', 'edu', 'gov', 'net', 'org', 'ne', 'or', 'go'}
+
+#Bounded so the cache stays a fixed size however many distinct urls a dump has
+@lru_cache(maxsize=1 << 16)
+def registered_domain(url):
+    """Reduce a url or hostname to its registered domain
+
+    http://x.com/a and https://www.x.com/b both become x.com. IP addresses
+    are returned as they are. Returns None for missing or unparseable
+    values.
+
+    Usage
+    ------
+
+    registered_domain('https://blog.example.co.uk:8080/post')  # 'example.co.uk'
+    """
+    if not isinstance(url, str):
+        return None
+    host = url.strip().lower()
+    if '://' in host:
+        host = host.split('://', 1)[1]
+    host = host.split('/', 1)[0].split('?', 1)[0].split('#', 1)[0].rsplit('@', 1)[-1]
+    if host.startswith('['):
+        host = host[1:].split(']', 1)[0]
+    else:
+        host = host.split(':', 1)[0]
+    host = host.strip('.')
+    #IP literals have no registered domain; keep the address itself
+    try:
+        return str(ipaddress.ip_address(host))
+    except ValueError:
+        pass
+    labels = [label for label in host.split('.') if label]
+    if len(labels) < 2:
+        return None
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in COUNTRY_SLDS:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+def index_path(path):
+    return path + '.domains.json'
+
+def offsets_path(path):
+    return path + '.domains.offsets'
+
+def fingerprint(path):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+def add_lines(index, lines, offsets):
+    urls = read.parse_lines(lines, ['url'])['url']
+    for offset, url in zip(offsets, urls):
+        domain = registered_domain(url)
+        if domain is not None:
+            index.setdefault(domain, []).append(offset)
+
+def build_index(path):
+    """Map each registered domain to the byte offsets of its rows in path"""
+    index = {}
+    with open(path, 'rb') as f:
+        f.readline()
+        position = f.tell()
+        lines = []
+        offsets = []
+        for line in f:
+            lines.append(line)
+            offsets.append(position)
+            position += len(line)
+            if len(lines) == read.CHUNKSIZE:
+                add_lines(index, lines, offsets)
+                lines = []
+                offsets = []
+        if lines:
+            add_lines(index, lines, offsets)
+    return index
+
+def replace_atomically(target, write, mode):
+    #Write to a temp file next to target, then swap it in whole
+    fd, temp = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(target)))
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.replace(temp, target)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+def save_index(path, index):
+    """Write the offsets as one int64 array grouped by domain, and per-domain [start, count] as json
+
+    Both files are swapped in whole, the json last, so a json whose
+    fingerprint matches always points into a complete offsets file.
+    """
+    domains = {}
+    position = 0
+    for domain, offsets in index.items():
+        domains[domain] = [position, len(offsets)]
+        position += len(offsets)
+
+    def write_offsets(f):
+        for offsets in index.values():
+            np.asarray(offsets, dtype='<i8').tofile(f)
+
+    def write_json(f):
+        json.dump({'source': fingerprint(path), 'domains': domains, 'offsets': position}, f)
+
+    replace_atomically(offsets_path(path), write_offsets, 'wb')
+    replace_atomically(index_path(path), write_json, 'w')
+    return domains
+
+def load_index(path='hn_stories.csv'):
+    """Load the domain index saved next to path, rebuilding it if path changed
+
+    Only the per-domain counts and positions are read here; a domain's row
+    offsets are read from the offsets file when it is drilled into.
+
+    Usage
+    ------
+
+    index = load_index()
+    top_domains(index)
+    """
+    saved = index_path(path)
+    if os.path.exists(saved) and os.path.exists(offsets_path(path)):
+        with open(saved) as f:
+            stored = json.load(f)
+        #A concurrent rebuild may have swapped in another offsets file, so check its length too
+        complete = os.path.getsize(offsets_path(path)) == stored.get('offsets', -1) * 8
+        if stored['source'] == fingerprint(path) and complete:
+            return stored['domains']
+    return save_index(path, build_index(path))
+
+def top_domains(index):
+    counts = pd.Series({domain: count for domain, (start, count) in index.items()}, dtype='int64')
+    return counts.sort_values(ascending = False)
+
+def domain_offsets(index, domain, path='hn_stories.csv'):
+    if domain not in index:
+        return np.empty(0, dtype='<i8')
+    start, count = index[domain]
+    return np.fromfile(offsets_path(path), dtype='<i8', count=count, offset=start * 8)
+
+def drilldown(index, domain, path='hn_stories.csv'):
+    """Return the rows for one domain by seeking straight to their offsets"""
+    lines = []
+    with open(path, 'rb') as f:
+        for offset in domain_offsets(index, domain, path):
+            f.seek(int(offset))
+            lines.append(f.readline())
+    if not lines:
+        return pd.DataFrame(columns=read.COLUMNS)
+    return read.parse_lines(lines)
+
+def count_chunk(domains, chunk):
+    return domains.add(chunk['url'].map(registered_domain).value_counts(), fill_value=0)
+
+def report(domains):
+    domains = domains.astype('int64').sort_values(ascending = False)
+    domains = domains[0:99:] #shows 100 items
+    for name, row in domains.items():
+        print("{0}: {1}".format(name, row))
+
+if __name__ == "__main__":
+    #Pass a domain name to list its stories instead of the top domains
+    index = load_index()
+    if len(sys.argv) > 1:
+        print(drilldown(index, registered_domain(sys.argv[1])))
+    else:
+        report(top_domains(index))
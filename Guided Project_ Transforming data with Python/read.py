@@ -1,6 +1,66 @@
+import io
+import os
+import sys
 import pandas as pd
 from collections import Counter
-def load_data():
-    data = pd.read_csv('hn_stories.csv')
-    data.columns = ['submission_time', 'upvotes', 'url', 'headline']
-    return data
\ No newline at end of file
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
+
+COLUMNS = ['submission_time', 'upvotes', 'url', 'headline']
+DTYPES = {'submission_time': 'str', 'upvotes': 'int64', 'url': 'str', 'headline': 'str'}
+CHUNKSIZE = 100000
+
+def load_data(chunksize=None, columns=None, dtypes=None):
+    """Load hn_stories.csv
+
+    With chunksize set, returns an iterator of DataFrames holding at most
+    chunksize rows each, so memory stays bounded however big the file is.
+    columns limits the parse to the named columns and dtypes overrides the
+    per-column types in DTYPES.
+
+    Usage
+    ------
+
+    data = load_data()
+    for chunk in load_data(chunksize=CHUNKSIZE, columns=['headline']):
+        ...
+    """
+    if chunksize is None and columns is None and dtypes is None:
+        data = csv_cache.read_csv('hn_stories.csv')
+        data.columns = COLUMNS
+        return data
+
+    types = dict(DTYPES)
+    if dtypes is not None:
+        types.update(dtypes)
+    if columns is not None:
+        types = {name: types[name] for name in columns if name in types}
+    return pd.read_csv('hn_stories.csv', header=0, names=COLUMNS,
+                       usecols=columns, dtype=types, chunksize=chunksize)
+
+def fold(chunks, func, initial):
+    """Fold func(accumulator, chunk) over an iterator of chunks
+
+    Usage
+    ------
+
+    total = fold(load_data(chunksize=CHUNKSIZE), lambda acc, c: acc + len(c), 0)
+    """
+    result = initial
+    for chunk in chunks:
+        result = func(result, chunk)
+    return result
+
+def parse_lines(lines, columns=None):
+    """Parse raw hn_stories.csv lines (bytes, no header) into a typed DataFrame
+
+    Usage
+    ------
+
+    chunk = parse_lines(lines, columns=['url'])
+    """
+    types = DTYPES
+    if columns is not None:
+        types = {name: DTYPES[name] for name in columns}
+    return pd.read_csv(io.BytesIO(b"".join(lines)), header=None, names=COLUMNS,
+                       usecols=columns, dtype=types)
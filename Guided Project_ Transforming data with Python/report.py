@@ -0,0 +1,17 @@
+import pandas as pd
+from collections import Counter
+from scan import Scan
+import count
+import domains
+import times
+
+#One read of hn_stories.csv feeds all three reports
+scan = Scan()
+scan.register('words', ['headline'], count.count_chunk, Counter)
+scan.register('domains', ['url'], domains.count_chunk, lambda: pd.Series(dtype='int64'))
+scan.register('hours', ['submission_time'], times.count_chunk, lambda: pd.Series(dtype='int64'))
+results = scan.run()
+
+count.report(results['words'])
+domains.report(results['domains'])
+times.report(results['hours'])
@@ -0,0 +1,33 @@
+import read
+
+class Scan:
+    """Run several reducers over hn_stories.csv in a single pass
+
+    Each reducer names the columns it needs, a func(accumulator, chunk)
+    folded over every chunk and a zero-argument factory for its initial
+    accumulator. The file is read once with the union of the columns.
+
+    Usage
+    ------
+
+    scan = Scan()
+    scan.register('words', ['headline'], count.count_chunk, Counter)
+    results = scan.run()
+    """
+    def __init__(self):
+        self.reducers = {}
+
+    def register(self, name, columns, func, initial):
+        self.reducers[name] = (columns, func, initial)
+
+    def run(self, chunksize=read.CHUNKSIZE, dtypes=None):
+        needed = set()
+        for columns, func, initial in self.reducers.values():
+            needed.update(columns)
+        columns = [name for name in read.COLUMNS if name in needed]
+
+        results = {name: reducer[2]() for name, reducer in self.reducers.items()}
+        for chunk in read.load_data(chunksize=chunksize, columns=columns, dtypes=dtypes):
+            for name, (columns, func, initial) in self.reducers.items():
+                results[name] = func(results[name], chunk)
+        return results
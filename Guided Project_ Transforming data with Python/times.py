@@ -2,7 +2,13 @@ import read
 import pandas as pd
 import datetime
 from dateutil.parser import parse
-data = read.load_data()
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+#Inferred strptime formats keyed by string length, e.g. 20 -> '%Y-%m-%dT%H:%M:%S%z'
+formats = {}
 
 def hour_extract(series):
     datetimeobj = parse(series)
@@ -10,12 +16,48 @@ def hour_extract(series):
     
     return hour
 
+def infer_format(sample):
+    key = len(sample)
+    if key not in formats:
+        formats[key] = guess_datetime_format(sample)
+    return formats[key]
+
+def hours_extract(series):
+    """Extract the hour from a whole column of timestamps at once
+
+    The dump mixes a couple of fixed ISO 8601 layouts that differ in length,
+    so the format is inferred once per length and each group is parsed in
+    bulk with pd.to_datetime. Groups whose format can't be inferred fall
+    back to hour_extract row by row.
+
+    Usage
+    ------
 
+    data['hour'] = hours_extract(data['submission_time'])
+    """
+    series = series.dropna()
+    hours = pd.Series(0, index=series.index, dtype='int64')
+    lengths = series.str.len()
+    for length in lengths.unique():
+        group = series[lengths == length]
+        fmt = infer_format(group.iloc[0])
+        try:
+            if fmt is None:
+                raise ValueError(group.iloc[0])
+            hours[group.index] = pd.to_datetime(group, format=fmt).dt.hour
+        except ValueError:
+            hours[group.index] = group.apply(hour_extract)
+    return hours
 
-data['hour'] = data['submission_time'].apply(hour_extract)
+def count_chunk(hours, chunk):
+    return hours.add(hours_extract(chunk['submission_time']).value_counts(), fill_value=0)
 
+def report(hours):
+    hours = hours.astype('int64').sort_values(ascending = False)
+    #hours = hours[0:24:] #shows 24 hours
+    for name, value in hours.items():
+        print("{0}: {1}".format(name, value))
 
-hours = data['hour'].value_counts(sort = True, ascending = False)
-#hours = hours[0:24:] #shows 24 hours
-for name, value in hours.items():
-    print("{0}: {1}".format(name, value))
\ No newline at end of file
+if __name__ == "__main__":
+    chunks = read.load_data(chunksize=read.CHUNKSIZE, columns=['submission_time'])
+    report(read.fold(chunks, count_chunk, pd.Series(dtype='int64')))
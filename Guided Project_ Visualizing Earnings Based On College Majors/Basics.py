@@ -22,9 +22,13 @@
 
 
 import pandas as pd
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 import matplotlib.pyplot as plt
 get_ipython().magic('matplotlib inline')
-recent_grads = pd.read_csv("recent-grads.csv")
+recent_grads = csv_cache.read_csv("recent-grads.csv")
 print(recent_grads.iloc[0])
 print(recent_grads.head())
 print(recent_grads.tail())
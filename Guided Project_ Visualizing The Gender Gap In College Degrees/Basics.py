@@ -8,9 +8,13 @@
 
 get_ipython().magic('matplotlib inline')
 import pandas as pd
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 import matplotlib.pyplot as plt
 
-women_degrees = pd.read_csv('percent-bachelors-degrees-women-usa.csv')
+women_degrees = csv_cache.read_csv('percent-bachelors-degrees-women-usa.csv')
 cb_dark_blue = (0/255,107/255,164/255)
 cb_orange = (255/255, 128/255, 14/255)
 stem_cats = ['Engineering', 'Computer Science', 'Psychology', 'Biology', 'Physical Sciences', 'Math and Statistics']
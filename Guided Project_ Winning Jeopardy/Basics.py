@@ -6,8 +6,12 @@
 
 import pandas
 import csv
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import csv_cache
 
-jeopardy = pandas.read_csv("jeopardy.csv")
+jeopardy = csv_cache.read_csv("jeopardy.csv")
 
 jeopardy
 
@@ -0,0 +1,152 @@
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+import resource
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from read import CONTENTS, Catalogue
+
+DATA = "./data/CRDC2013_14.csv"
+FLAGS = ["JJ", "SCH_STATUS_MAGNET"]
+COUNTS = ["TOT_ENR_M", "TOT_ENR_F"]
+CACHE_DIR = "./data/.crdc_cache"
+
+#Aggregates already answered in this process, keyed like the files in CACHE_DIR
+results = {}
+#Data dictionaries parsed in this process, keyed on their path
+catalogues = {}
+
+def catalogue(contents=CONTENTS):
+    if contents not in catalogues:
+        catalogues[contents] = Catalogue(contents)
+    return catalogues[contents]
+
+def load_full(path=DATA):
+    return pd.read_csv(path, encoding="Latin-1")
+
+def load(path=DATA, flags=FLAGS, counts=COUNTS):
+    """Load only the flag and enrollment columns of the CRDC file
+
+    Columns may be given by variable name or documented label and are
+    resolved, and their text/numeric types set, through the data dictionary
+    Catalogue. On top of that flag columns come back as categoricals and
+    enrollment columns as the smallest integer type that holds them. The
+    file is memory-mapped rather than read into a buffer first.
+
+    Usage
+    ------
+
+    data = load(counts=["Total Number of Students Enrolled: Male", "TOT_ENR_F"])
+    """
+    schema = catalogue()
+    flags = [schema.resolve(flag) for flag in flags]
+    counts = [schema.resolve(count) for count in counts]
+    data = schema.load(flags + counts, path, dtype={flag: "category" for flag in flags})
+    for count in counts:
+        data[count] = pd.to_numeric(data[count], downcast="integer")
+    return data
+
+def fingerprint(path):
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+def cache_name(key):
+    """source-stamp-rest hashes, so entries for an older copy of the file can be found"""
+    (source, mtime, size), rest = key[0], key[1:]
+    return "-".join(hashlib.sha1(repr(part).encode("utf-8")).hexdigest()[:16]
+                    for part in (source, (mtime, size), rest)) + ".pkl"
+
+def prune(key):
+    """Drop cached aggregates of key's CRDC file computed before it last changed"""
+    source, stamp = cache_name(key).split("-")[:2]
+    for entry in os.listdir(CACHE_DIR):
+        parts = entry.split("-")
+        if len(parts) == 3 and parts[0] == source and parts[1] != stamp:
+            try:
+                os.remove(os.path.join(CACHE_DIR, entry))
+            except OSError:
+                pass
+    for stale in [other for other in results if other[0][0] == key[0][0] and other[0] != key[0]]:
+        del results[stale]
+
+def cached(path, index, values, aggfunc, compute):
+    """Return a copy of compute() for this aggregate, caching it in memory and on disk
+
+    The key includes the file's path, mtime and size, so editing or
+    replacing the CRDC file misses the cache and recomputes; the entries
+    for the old file are deleted when the new result is written. Callers
+    get their own copy, so changing it can't alter later answers.
+    """
+    key = (fingerprint(path), index, tuple(values), aggfunc)
+    if key in results:
+        return results[key].copy()
+    cache_file = os.path.join(CACHE_DIR, cache_name(key))
+    if os.path.exists(cache_file):
+        with open(cache_file, "rb") as f:
+            result = pickle.load(f)
+    else:
+        result = compute()
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, temp = tempfile.mkstemp(suffix=".tmp", dir=CACHE_DIR)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(result, f)
+        os.replace(temp, cache_file)
+        prune(key)
+    results[key] = result
+    return result.copy()
+
+def value_counts(column, path=DATA):
+    """Cached data[column].value_counts() over the CRDC file
+
+    Usage
+    ------
+
+    value_counts("JJ")
+    value_counts("School Characteristics: Magnet school or school operating a magnet program within the school")
+    """
+    column = catalogue().resolve(column)
+    return cached(path, column, [], "value_counts",
+                  lambda: load(path, flags=[column], counts=[])[column].value_counts())
+
+def pivot(index, values=COUNTS, aggfunc="sum", path=DATA):
+    """Cached pd.pivot_table(data, values, index, aggfunc) over the CRDC file
+
+    Usage
+    ------
+
+    pivot("JJ", ["Total Number of Students Enrolled: Male", "TOT_ENR_F"])
+    """
+    index = catalogue().resolve(index)
+    values = [catalogue().resolve(value) for value in values]
+    def compute():
+        data = load(path, flags=[index], counts=values)
+        return pd.pivot_table(data, values=values, index=index, aggfunc=aggfunc, observed=True)
+    return cached(path, index, values, aggfunc, compute)
+
+def measure(loader, path):
+    data = loader(path)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    #ru_maxrss is kilobytes on Linux and bytes on macOS
+    if sys.platform != "darwin":
+        peak *= 1024
+    return peak, int(data.memory_usage(deep=True).sum())
+
+def peak_rss(loader, path=DATA):
+    """Run loader in a fresh process and return (peak RSS, frame size) in bytes
+
+    An exception raised by loader in the child is re-raised here.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(measure, loader, path).result()
+
+if __name__ == "__main__":
+    full_peak, full_size = peak_rss(load_full)
+    peak, size = peak_rss(load)
+    mb = 1024 * 1024
+    print("full load:      peak RSS {0:.1f} MB, frame {1:.1f} MB".format(full_peak / mb, full_size / mb))
+    print("projected load: peak RSS {0:.1f} MB, frame {1:.1f} MB".format(peak / mb, size / mb))
+    print("peak RSS saving: {0:.1f} MB".format((full_peak - peak) / mb))
@@ -1,8 +1,7 @@
-import pandas as pd
+import crdc
 
-data = pd.read_csv("./data/CRDC2013_14.csv", encoding="Latin-1")
-print(data["JJ"].value_counts())
-print(data["SCH_STATUS_MAGNET"].value_counts())
+print(crdc.value_counts("JJ"))
+print(crdc.value_counts("SCH_STATUS_MAGNET"))
 
-print(pd.pivot_table(data, values=["TOT_ENR_M", "TOT_ENR_F"], index="JJ", aggfunc="sum"))
-print(pd.pivot_table(data, values=["TOT_ENR_M", "TOT_ENR_F"], index="SCH_STATUS_MAGNET", aggfunc="sum"))
\ No newline at end of file
+print(crdc.pivot("JJ", ["TOT_ENR_M", "TOT_ENR_F"], aggfunc="sum"))
+print(crdc.pivot("SCH_STATUS_MAGNET", ["TOT_ENR_M", "TOT_ENR_F"], aggfunc="sum"))
\ No newline at end of file
@@ -1,6 +1,50 @@
 import pandas as pd
-    
+
+CONTENTS = "./data/CRDC2013_14content.csv"
+DATA = "./data/CRDC2013_14.csv"
+
+class Catalogue:
+    """Schema of CRDC2013_14.csv built from its data dictionary
+
+    Columns can be asked for by variable name (TOT_ENR_M) or by documented
+    label (Total Number of Students Enrolled: Male). load() parses only the
+    requested columns from the main file, reading text variables as strings
+    and leaving numeric ones to pandas.
+
+    Usage
+    ------
+
+    catalogue = Catalogue()
+    data = catalogue.load(["JJ", "Total Number of Students Enrolled: Male"])
+    """
+    def __init__(self, contents=CONTENTS):
+        self.contents = pd.read_csv(contents)
+        self.types = dict(zip(self.contents["NAME"], self.contents["TYPE"]))
+        self.labels = dict(zip(self.contents["LABEL"], self.contents["NAME"]))
+
+    def resolve(self, column):
+        if column in self.types:
+            return column
+        if column in self.labels:
+            return self.labels[column]
+        raise KeyError("{0} is not a CRDC variable name or label".format(column))
+
+    def search(self, text):
+        """Return the dictionary rows whose label mentions text"""
+        matches = self.contents["LABEL"].str.contains(text, case=False, regex=False)
+        return self.contents[matches]
+
+    def dtypes(self, names):
+        return {name: "str" for name in names if self.types[name] == "text"}
+
+    def load(self, columns, path=DATA, dtype=None):
+        """Read columns by name or label; dtype overrides the dictionary's types by name"""
+        names = [self.resolve(column) for column in columns]
+        dtypes = self.dtypes(names)
+        dtypes.update(dtype or {})
+        return pd.read_csv(path, encoding="Latin-1", usecols=names,
+                           dtype=dtypes, memory_map=True)[names]
 
 if __name__ == "__main__":
-    contents = pd.read_csv("./data/CRDC2013_14content.csv")
-    print(contents.head(3))
\ No newline at end of file
+    contents = pd.read_csv(CONTENTS)
+    print(contents.head(3))
@@ -0,0 +1,100 @@
+import os
+import hashlib
+import tempfile
+import pandas as pd
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+CACHE_DIR = '.csv_cache'
+
+def cache_key(path, options):
+    """Key a cached frame on the source path, its mtime and size and the read options
+
+    The key reads source-stamp-options so entries for an older copy of the
+    same file can be found and removed.
+    """
+    stat = os.stat(path)
+    source = os.path.abspath(path)
+    stamp = "{0}:{1}".format(stat.st_mtime_ns, stat.st_size)
+    settings = "\n".join("{0}={1!r}".format(name, options[name]) for name in sorted(options))
+    return "-".join(hashlib.sha1(part.encode('utf-8')).hexdigest()[:16]
+                    for part in (source, stamp, settings))
+
+def cache_path(path, options):
+    directory = os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR)
+    extension = '.feather' if feather is not None else '.pkl'
+    return os.path.join(directory, cache_key(path, options) + extension)
+
+def prune(cached):
+    """Remove cached copies of the same source file taken before it last changed"""
+    directory, name = os.path.split(cached)
+    source, stamp = name.split('-')[:2]
+    for entry in os.listdir(directory):
+        parts = entry.split('-')
+        if len(parts) == 3 and parts[0] == source and parts[1] != stamp:
+            try:
+                os.remove(os.path.join(directory, entry))
+            except OSError:
+                pass
+
+def read_cached(cached):
+    if cached.endswith('.feather'):
+        return feather.read_table(cached, memory_map=True).to_pandas()
+    return pd.read_pickle(cached)
+
+def write_cached(df, cached):
+    """Save df as the cached copy; on any filesystem error (e.g. a read-only data directory) skip caching"""
+    directory = os.path.dirname(cached)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        #A temp file of its own, so concurrent writers of the same entry can't clobber each other
+        fd, temp = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        os.close(fd)
+    except OSError:
+        return
+    try:
+        if cached.endswith('.feather'):
+            try:
+                feather.write_feather(df, temp)
+            except (ValueError, TypeError):
+                #Feather needs string column names and a default index
+                return
+        else:
+            df.to_pickle(temp)
+        os.replace(temp, cached)
+        prune(cached)
+    except OSError:
+        return
+    finally:
+        if os.path.exists(temp):
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+
+def read_csv(path, **options):
+    """Drop-in pd.read_csv that keeps a typed columnar copy of each parse
+
+    The first read of a file with a given set of options parses the CSV and
+    writes the frame to .csv_cache/ next to it (Feather when pyarrow is
+    installed, pickle otherwise). Later reads with the same options
+    memory-map that copy instead of re-parsing, until the CSV's mtime or
+    size changes; writing the new copy then deletes the stale ones.
+    Streaming reads (chunksize/iterator) go straight to pandas.
+
+    Usage
+    ------
+
+    import csv_cache
+    df = csv_cache.read_csv('sphist.csv')
+    """
+    if options.get('chunksize') is not None or options.get('iterator'):
+        return pd.read_csv(path, **options)
+    cached = cache_path(path, options)
+    if os.path.exists(cached):
+        return read_cached(cached)
+    df = pd.read_csv(path, **options)
+    write_cached(df, cached)
+    return df